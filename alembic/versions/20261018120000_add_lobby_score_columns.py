@@ -0,0 +1,86 @@
+"""add_lobby_score_columns
+
+Revision ID: 3b7e2c9d41a6
+Revises: f0fcfc0e433e
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7e2c9d41a6'
+down_revision = 'f0fcfc0e433e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.add_column('lobby', sa.Column('creator_wins', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('lobby', sa.Column('player_wins', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('lobby', sa.Column('draws', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('lobby', sa.Column('current_game_index', sa.Integer(), server_default='0', nullable=False))
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_column('lobby', 'current_game_index')
+    op.drop_column('lobby', 'draws')
+    op.drop_column('lobby', 'player_wins')
+    op.drop_column('lobby', 'creator_wins')
+
+
+def data_upgrades():
+    # Played games are finished games where both players made a move, games
+    # finished early after someone got the majority have no cards
+    op.execute("""
+        UPDATE lobby SET
+            creator_wins = score.creator_wins,
+            player_wins = score.player_wins,
+            draws = score.draws,
+            current_game_index = score.played
+        FROM (
+            SELECT
+                game.lobby_id,
+                count(*) FILTER (WHERE game.winner_id = game.creator_id) AS creator_wins,
+                count(*) FILTER (WHERE game.winner_id = game.player_id) AS player_wins,
+                count(*) FILTER (WHERE game.winner_id IS NULL) AS draws,
+                count(*) AS played
+            FROM game
+            WHERE game.game_status_id = 3
+                AND game.creator_card_id IS NOT NULL
+                AND game.player_card_id IS NOT NULL
+            GROUP BY game.lobby_id
+        ) AS score
+        WHERE lobby.id = score.lobby_id
+    """)
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
@@ -0,0 +1,59 @@
+"""add_lobby_opened_index
+
+Revision ID: 9d4f1a0c7e25
+Revises: 3b7e2c9d41a6
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4f1a0c7e25'
+down_revision = '3b7e2c9d41a6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.create_index('lobby_opened_status_id_idx', 'lobby', ['lobby_status_id', 'id'], unique=False, postgresql_where=sa.text('lobby_status_id = 1'))
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_index('lobby_opened_status_id_idx', table_name='lobby', postgresql_where=sa.text('lobby_status_id = 1'))
+
+
+def data_upgrades():
+    """Add any optional data upgrade migrations here!"""
+    pass
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
@@ -0,0 +1,59 @@
+"""add_lobby_version
+
+Revision ID: 5c2e8b7f1a93
+Revises: 9d4f1a0c7e25
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8b7f1a93'
+down_revision = '9d4f1a0c7e25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.add_column('lobby', sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_column('lobby', 'version')
+
+
+def data_upgrades():
+    """Add any optional data upgrade migrations here!"""
+    pass
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
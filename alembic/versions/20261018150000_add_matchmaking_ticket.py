@@ -0,0 +1,71 @@
+"""add_matchmaking_ticket
+
+Revision ID: a8d3f6e2b154
+Revises: 5c2e8b7f1a93
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d3f6e2b154'
+down_revision = '5c2e8b7f1a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.create_table('matchmaking_ticket',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_dt', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+    sa.Column('max_games', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('lobby_type_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['lobby_type_id'], ['lobby_type.id'], ondelete='cascade'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='cascade'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    op.create_index('matchmaking_ticket_queue_idx', 'matchmaking_ticket', ['lobby_type_id', 'max_games', 'id'], unique=False)
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_index('matchmaking_ticket_queue_idx', table_name='matchmaking_ticket')
+    op.drop_table('matchmaking_ticket')
+
+
+def data_upgrades():
+    """Add any optional data upgrade migrations here!"""
+    pass
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
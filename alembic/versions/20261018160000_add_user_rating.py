@@ -0,0 +1,67 @@
+"""add_user_rating
+
+Revision ID: e4b7c1d9f620
+Revises: a8d3f6e2b154
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7c1d9f620'
+down_revision = 'a8d3f6e2b154'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.create_table('user_rating',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('rating', sa.Float(), server_default='1000.0', nullable=False),
+    sa.Column('games', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='cascade'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index('user_rating_rating_idx', 'user_rating', [sa.text('rating DESC'), 'user_id'], unique=False)
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_index('user_rating_rating_idx', table_name='user_rating')
+    op.drop_table('user_rating')
+
+
+def data_upgrades():
+    """Add any optional data upgrade migrations here!"""
+    pass
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
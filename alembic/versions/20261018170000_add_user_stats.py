@@ -0,0 +1,101 @@
+"""add_user_stats
+
+Revision ID: b1f9a7c3e582
+Revises: e4b7c1d9f620
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b1f9a7c3e582'
+down_revision = 'e4b7c1d9f620'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('games', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('wins', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('losses', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('draws', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('rock_played', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('paper_played', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('scissors_played', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('lizard_played', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('spock_played', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='cascade'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_table('user_stats')
+
+
+def data_upgrades():
+    # Card ids are the ones of consts.Card
+    op.execute("""
+        INSERT INTO user_stats (
+            user_id, games, wins, losses, draws,
+            rock_played, paper_played, scissors_played, lizard_played,
+            spock_played
+        )
+        SELECT
+            move.user_id,
+            count(*),
+            count(*) FILTER (WHERE move.winner_id = move.user_id),
+            count(*) FILTER (WHERE move.winner_id <> move.user_id),
+            count(*) FILTER (WHERE move.winner_id IS NULL),
+            count(*) FILTER (WHERE move.card_id = 1),
+            count(*) FILTER (WHERE move.card_id = 2),
+            count(*) FILTER (WHERE move.card_id = 3),
+            count(*) FILTER (WHERE move.card_id = 4),
+            count(*) FILTER (WHERE move.card_id = 5)
+        FROM (
+            SELECT creator_id AS user_id, creator_card_id AS card_id, winner_id
+            FROM game
+            WHERE game_status_id = 3 AND creator_card_id IS NOT NULL
+                AND player_card_id IS NOT NULL
+            UNION ALL
+            SELECT player_id, player_card_id, winner_id
+            FROM game
+            WHERE game_status_id = 3 AND creator_card_id IS NOT NULL
+                AND player_card_id IS NOT NULL
+        ) AS move
+        GROUP BY move.user_id
+    """)
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
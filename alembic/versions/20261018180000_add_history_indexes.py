@@ -0,0 +1,67 @@
+"""add_history_indexes
+
+Revision ID: c6e0d2a8b473
+Revises: b1f9a7c3e582
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e0d2a8b473'
+down_revision = 'b1f9a7c3e582'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.create_index('lobby_creator_id_created_dt_idx', 'lobby', ['creator_id', 'created_dt', 'id'], unique=False)
+    op.create_index('lobby_player_id_created_dt_idx', 'lobby', ['player_id', 'created_dt', 'id'], unique=False)
+    op.create_index('game_creator_id_idx', 'game', ['creator_id'], unique=False)
+    op.create_index('game_player_id_idx', 'game', ['player_id'], unique=False)
+    op.create_index('game_lobby_id_id_idx', 'game', ['lobby_id', 'id'], unique=False)
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_index('game_lobby_id_id_idx', table_name='game')
+    op.drop_index('game_player_id_idx', table_name='game')
+    op.drop_index('game_creator_id_idx', table_name='game')
+    op.drop_index('lobby_player_id_created_dt_idx', table_name='lobby')
+    op.drop_index('lobby_creator_id_created_dt_idx', table_name='lobby')
+
+
+def data_upgrades():
+    """Add any optional data upgrade migrations here!"""
+    pass
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
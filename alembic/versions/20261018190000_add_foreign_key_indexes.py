@@ -0,0 +1,69 @@
+"""add_foreign_key_indexes
+
+Revision ID: f7a2c5e9d316
+Revises: c6e0d2a8b473
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7a2c5e9d316'
+down_revision = 'c6e0d2a8b473'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.create_index('phone_number_idx', 'phone', ['number'], unique=False)
+    op.create_index('user_phone_id_idx', 'user', ['phone_id'], unique=False)
+    op.create_index('user_current_lobby_id_idx', 'user', ['current_lobby_id'], unique=False, postgresql_where=sa.text('current_lobby_id IS NOT NULL'))
+    op.create_index('game_winner_id_idx', 'game', ['winner_id'], unique=False, postgresql_where=sa.text('winner_id IS NOT NULL'))
+    op.create_index('confirmation_code_phone_id_id_idx', 'confirmation_code', ['phone_id', 'id'], unique=False)
+    op.create_index('certificate_user_id_idx', 'certificate', ['user_id'], unique=False)
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_index('certificate_user_id_idx', table_name='certificate')
+    op.drop_index('confirmation_code_phone_id_id_idx', table_name='confirmation_code')
+    op.drop_index('game_winner_id_idx', table_name='game', postgresql_where=sa.text('winner_id IS NOT NULL'))
+    op.drop_index('user_current_lobby_id_idx', table_name='user', postgresql_where=sa.text('current_lobby_id IS NOT NULL'))
+    op.drop_index('user_phone_id_idx', table_name='user')
+    op.drop_index('phone_number_idx', table_name='phone')
+
+
+def data_upgrades():
+    """Add any optional data upgrade migrations here!"""
+    pass
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
@@ -0,0 +1,90 @@
+"""replace_lookup_foreign_keys_with_checks
+
+Revision ID: 0b8e4d6f2a71
+Revises: f7a2c5e9d316
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b8e4d6f2a71'
+down_revision = 'f7a2c5e9d316'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    # Lookup tables are verified against consts at startup
+    op.drop_constraint('lobby_lobby_status_id_fkey', 'lobby', type_='foreignkey')
+    op.create_check_constraint('lobby_lobby_status_id_check', 'lobby', 'lobby_status_id IN (1, 2, 3, 4)')
+    op.drop_constraint('lobby_lobby_type_id_fkey', 'lobby', type_='foreignkey')
+    op.create_check_constraint('lobby_lobby_type_id_check', 'lobby', 'lobby_type_id IN (1, 2)')
+    op.drop_constraint('matchmaking_ticket_lobby_type_id_fkey', 'matchmaking_ticket', type_='foreignkey')
+    op.create_check_constraint('matchmaking_ticket_lobby_type_id_check', 'matchmaking_ticket', 'lobby_type_id IN (1, 2)')
+    op.drop_constraint('game_creator_card_id_fkey', 'game', type_='foreignkey')
+    op.create_check_constraint('game_creator_card_id_check', 'game', 'creator_card_id IN (1, 2, 3, 4, 5)')
+    op.drop_constraint('game_player_card_id_fkey', 'game', type_='foreignkey')
+    op.create_check_constraint('game_player_card_id_check', 'game', 'player_card_id IN (1, 2, 3, 4, 5)')
+    op.drop_constraint('game_game_status_id_fkey', 'game', type_='foreignkey')
+    op.create_check_constraint('game_game_status_id_check', 'game', 'game_status_id IN (1, 2, 3, 4)')
+    op.drop_constraint('game_game_type_id_fkey', 'game', type_='foreignkey')
+    op.create_check_constraint('game_game_type_id_check', 'game', 'game_type_id IN (1, 2)')
+    op.drop_constraint('confirmation_code_type_id_fkey', 'confirmation_code', type_='foreignkey')
+    op.create_check_constraint('confirmation_code_type_id_check', 'confirmation_code', 'type_id IN (1, 2)')
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_constraint('lobby_lobby_status_id_check', 'lobby', type_='check')
+    op.create_foreign_key('lobby_lobby_status_id_fkey', 'lobby', 'lobby_status', ['lobby_status_id'], ['id'], ondelete='cascade')
+    op.drop_constraint('lobby_lobby_type_id_check', 'lobby', type_='check')
+    op.create_foreign_key('lobby_lobby_type_id_fkey', 'lobby', 'lobby_type', ['lobby_type_id'], ['id'], ondelete='cascade')
+    op.drop_constraint('matchmaking_ticket_lobby_type_id_check', 'matchmaking_ticket', type_='check')
+    op.create_foreign_key('matchmaking_ticket_lobby_type_id_fkey', 'matchmaking_ticket', 'lobby_type', ['lobby_type_id'], ['id'], ondelete='cascade')
+    op.drop_constraint('game_creator_card_id_check', 'game', type_='check')
+    op.create_foreign_key('game_creator_card_id_fkey', 'game', 'card', ['creator_card_id'], ['id'], ondelete='cascade')
+    op.drop_constraint('game_player_card_id_check', 'game', type_='check')
+    op.create_foreign_key('game_player_card_id_fkey', 'game', 'card', ['player_card_id'], ['id'], ondelete='cascade')
+    op.drop_constraint('game_game_status_id_check', 'game', type_='check')
+    op.create_foreign_key('game_game_status_id_fkey', 'game', 'game_status', ['game_status_id'], ['id'], ondelete='cascade')
+    op.drop_constraint('game_game_type_id_check', 'game', type_='check')
+    op.create_foreign_key('game_game_type_id_fkey', 'game', 'lobby_type', ['game_type_id'], ['id'], ondelete='cascade')
+    op.drop_constraint('confirmation_code_type_id_check', 'confirmation_code', type_='check')
+    op.create_foreign_key('confirmation_code_type_id_fkey', 'confirmation_code', 'confirmation_code_type', ['type_id'], ['id'], ondelete='cascade')
+
+
+def data_upgrades():
+    """Add any optional data upgrade migrations here!"""
+    pass
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
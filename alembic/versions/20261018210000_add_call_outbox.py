@@ -0,0 +1,71 @@
+"""add_call_outbox
+
+Revision ID: d3a9e1f5c842
+Revises: 0b8e4d6f2a71
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+from alembic import context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3a9e1f5c842'
+down_revision = '0b8e4d6f2a71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    schema_upgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_upgrades()
+    post_data_schema_upgrades()
+
+
+def downgrade():
+    before_data_schema_downgrades()
+    if not context.get_x_argument(as_dictionary=True).get('disable-data', None):
+        data_downgrades()
+    schema_downgrades()
+
+
+def schema_upgrades():
+    """schema upgrade migrations go here."""
+    op.create_table('call_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_dt', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('next_attempt_dt', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('confirmation_code_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['confirmation_code_id'], ['confirmation_code.id'], ondelete='cascade'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('confirmation_code_id')
+    )
+    op.create_index('call_outbox_next_attempt_dt_idx', 'call_outbox', ['next_attempt_dt'], unique=False)
+
+
+def schema_downgrades():
+    """schema downgrade migrations go here."""
+    op.drop_index('call_outbox_next_attempt_dt_idx', table_name='call_outbox')
+    op.drop_table('call_outbox')
+
+
+def data_upgrades():
+    """Add any optional data upgrade migrations here!"""
+    pass
+
+
+def data_downgrades():
+    """Add any optional data downgrade migrations here!"""
+    pass
+
+
+def post_data_schema_upgrades():
+    pass
+
+
+def before_data_schema_downgrades():
+    pass
@@ -0,0 +1,37 @@
+"""Measures throughput of NewTel calls made through the shared client.
+
+Start the stub first, then:
+    NEWTEL_API_URL=http://localhost:8001/ \
+        python benchmarks/call_throughput.py --calls 1000 --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+
+from rockps.adapters import clients
+from rockps.adapters.services.external import call
+
+
+async def main(calls: int, concurrency: int):
+    clients.HttpClients.init()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def make_call():
+        async with semaphore:
+            await call.call("+79000000000", "1234")
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(make_call() for _ in range(calls)))
+    finally:
+        await clients.Httpx.close_all()
+    elapsed = time.perf_counter() - started
+    print(f"{calls} calls in {elapsed:.2f}s, {calls / elapsed:.0f} calls/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NewTel call throughput")
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.concurrency))
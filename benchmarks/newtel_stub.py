@@ -0,0 +1,28 @@
+"""Stub of NewTel call-password API for local benchmarks.
+
+Answers every call with success after NEWTEL_STUB_LATENCY seconds.
+
+Usage: NEWTEL_STUB_LATENCY=0.1 uvicorn benchmarks.newtel_stub:app --port 8001
+"""
+import asyncio
+import itertools
+import os
+
+import fastapi
+
+LATENCY = float(os.environ.get("NEWTEL_STUB_LATENCY", 0.1))
+
+app = fastapi.FastAPI()
+_CALL_IDS = itertools.count(1)
+
+
+@app.post("/call-password/start-password-call")
+async def start_password_call():
+    await asyncio.sleep(LATENCY)
+    return {
+        "status": "success",
+        "data": {
+            "result": "success",
+            "callDetails": {"callId": str(next(_CALL_IDS))},
+        },
+    }
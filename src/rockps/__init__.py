@@ -38,11 +38,23 @@ def init() -> fastapi.FastAPI:
     async def on_startup_setup():
         # Infrastructure setup
         adapters.engines.Database.init()
+        adapters.sessions.SessionFactory.init()
+        await adapters.references.verify()
+        adapters.hashers.PasswordHasher.init()
+        adapters.clients.HttpClients.init()
+        adapters.events.EventBus.init()
+        adapters.outbox.CallOutbox.start()
+        adapters.janitor.Janitor.start()
         await infrastructure.web_framework.routes.init(app)
 
     @app.on_event("shutdown")
     async def on_shutdown_cleanup():
         # Sessions cleanup
+        await adapters.janitor.Janitor.stop()
+        await adapters.outbox.CallOutbox.stop()
         await adapters.clients.Httpx.close_all()
+        adapters.hashers.PasswordHasher.shutdown()
+        await adapters.events.EventBus.close()
+        await adapters.engines.Database.close()
 
     return app
@@ -3,5 +3,11 @@
 from rockps.adapters.db import models
 from rockps.adapters import views
 from rockps.adapters import engines
+from rockps.adapters import sessions
 from rockps.adapters import clients
 from rockps.adapters import services
+from rockps.adapters import hashers
+from rockps.adapters import events
+from rockps.adapters import references
+from rockps.adapters import outbox
+from rockps.adapters import janitor
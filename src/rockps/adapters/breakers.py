@@ -0,0 +1,139 @@
+import random
+import time
+from typing import Type
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service while its circuit is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Circuit is open, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Stops calling a failing service for a while.
+
+    Used as a context manager around a call. Opens after failure_threshold
+    consecutive failures, i.e. calls raising one of failure_types, and rejects
+    calls for recovery_timeout seconds. Then lets a single probe call
+    through: its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_timeout: float,
+        failure_types: tuple[Type[BaseException], ...],
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failure_types = failure_types
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._retry_after() <= 0:
+            return HALF_OPEN
+        return self._state
+
+    def _retry_after(self) -> float:
+        return self._opened_at + self.recovery_timeout - time.monotonic()
+
+    def before_call(self) -> None:
+        """Raises CircuitOpenError if the call must not be made now."""
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and not self._probing:
+            self._state = HALF_OPEN
+            self._probing = True
+            return
+        self.rejected += 1
+        if state == HALF_OPEN:
+            # Probe is still running and may open the circuit again, so
+            # rejected calls wait as long as after a failed probe
+            raise CircuitOpenError(self.recovery_timeout)
+        raise CircuitOpenError(self._retry_after())
+
+    def __enter__(self) -> "CircuitBreaker":
+        self.before_call()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.on_success()
+        elif issubclass(exc_type, self.failure_types):
+            self.on_failure()
+        else:
+            # Outcome says nothing about the service, let another call probe
+            self._probing = False
+
+    def on_success(self) -> None:
+        self._state = CLOSED
+        self._probing = False
+        self.failures = 0
+
+    def on_failure(self) -> None:
+        self.failures += 1
+        if self._state == HALF_OPEN or \
+                self.failures >= self.failure_threshold:
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
+            self.opened += 1
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class RetryBudget:
+    """Limits retries to a share of calls, so retries can't multiply load.
+
+    Every call deposits ratio of a token, every retry withdraws a whole one.
+    Tokens are capped by max_tokens, which is also the initial balance.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.retried = 0
+        self.exhausted = 0
+        self._tokens = max_tokens
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1:
+            self.exhausted += 1
+            return False
+        self._tokens -= 1
+        self.retried += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "tokens": round(self._tokens, 2),
+            "retried": self.retried,
+            "exhausted": self.exhausted,
+        }
+
+
+def backoff(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -0,0 +1,47 @@
+import collections
+import time
+from typing import Any
+from typing import Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire at a given unix timestamp."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: collections.OrderedDict[Hashable, tuple[Any, float]] = \
+            collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value, expires_at = self._data.get(key, (_MISSING, 0))
+        if value is _MISSING or expires_at <= time.time():
+            self._data.pop(key, None)
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
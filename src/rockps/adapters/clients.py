@@ -2,16 +2,55 @@ import weakref
 
 import httpx
 
+from rockps import settings
+
 
 class Httpx(httpx.AsyncClient):
-    __refs__ = []
+    # Weak set forgets collected clients, so it doesn't grow with every client
+    __refs__: weakref.WeakSet = weakref.WeakSet()
 
     def __init__(self, **kwargs) -> None:
-        self.__refs__.append(weakref.ref(self))
         super().__init__(**kwargs)
+        self.__refs__.add(self)
 
     @classmethod
     async def close_all(cls):
-        for ref in cls.__refs__:
-            if (instance := ref()) is not None:
-                await instance.aclose()
+        for instance in list(cls.__refs__):
+            await instance.aclose()
+
+
+class HttpClients:
+    """Clients of external services shared by all requests of the worker.
+
+    One client per service keeps a pool of keep-alive connections, so calls
+    don't pay for TCP and TLS handshakes every time.
+    """
+    _CLIENTS: dict[str, Httpx]
+
+    @classmethod
+    def init(cls):
+        cls._CLIENTS = {
+            "newtel": cls.create(base_url=settings.NEWTEL_API_URL),
+        }
+
+    @classmethod
+    def create(cls, **kwargs) -> Httpx:
+        return Httpx(
+            http2=settings.HTTP_CLIENT_HTTP2,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=(
+                    settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                settings.HTTP_CLIENT_TIMEOUT,
+                connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT,
+            ),
+            **kwargs,
+        )
+
+    @classmethod
+    def get(cls, name: str) -> Httpx:
+        return cls._CLIENTS[name]
@@ -2,7 +2,6 @@ import datetime
 import re
 from uuid import uuid4
 
-import bcrypt
 import sqlalchemy as sa
 import sqlalchemy.orm as sa_orm
 from jose import jwt
@@ -10,6 +9,7 @@ from sqlalchemy.dialects import postgresql as sa_pgsql
 from sqlalchemy.ext import declarative as sa_declarative
 
 from rockps import settings
+from rockps.adapters import hashers
 
 
 class AutoTableName:
@@ -25,16 +25,16 @@ Base = sa_orm.declarative_base(cls=AutoTableName)
 class Password:
 
     def set_password(self, password: str):
-        self.password = bcrypt.hashpw(  # pylint: disable=attribute-defined-outside-init
-            password=bytes(password, "ascii"),
-            salt=bcrypt.gensalt(),
-        )
+        self.password = hashers.hash_password(password)  # pylint: disable=attribute-defined-outside-init
 
     def is_right_password(self, password: str):
-        return bcrypt.checkpw(
-            password=bytes(password, "ascii"),
-            hashed_password=self.password,
-        )
+        return hashers.check_password(password, self.password)
+
+    async def set_password_async(self, password: str):
+        self.password = await hashers.PasswordHasher.hash(password)  # pylint: disable=attribute-defined-outside-init
+
+    async def is_right_password_async(self, password: str):
+        return await hashers.PasswordHasher.check(password, self.password)
 
 
 class JWT:
@@ -5,9 +5,26 @@ from sqlalchemy import orm
 from sqlalchemy.dialects import postgresql as sa_pgsql
 
 from rockps import consts
+from rockps import entities
 from rockps.adapters.db import mixins
 
 
+def _in_enum(
+    table: str,
+    column: str,
+    enum: type[consts.DictMixin],
+) -> sa.CheckConstraint:
+    """Limits column to enum values.
+
+    Used instead of FKs to lookup tables, which are verified against consts
+    at startup, so writes don't have to check lookup rows.
+    """
+    return sa.CheckConstraint(
+        f"{column} IN ({', '.join(map(str, enum.values()))})",
+        name=f"{table}_{column}_check",
+    )
+
+
 class Card(
     mixins.Base,
     mixins.IntPrimaryKey,
@@ -99,6 +116,8 @@ class Phone(
             unique=True,
             postgresql_where=is_confirmed,
         ),
+        # Unconfirmed numbers are looked up on confirmation
+        sa.Index('phone_number_idx', number),
     )
 
 
@@ -137,6 +156,15 @@ class User(
         foreign_keys=[phone_id],
     )
 
+    __table_args__ = (
+        sa.Index('user_phone_id_idx', phone_id),
+        sa.Index(
+            'user_current_lobby_id_idx',
+            current_lobby_id,
+            postgresql_where=current_lobby_id.is_not(None),
+        ),
+    )
+
 
 class Lobby(
     mixins.Base,
@@ -151,6 +179,40 @@ class Lobby(
         nullable=False,
     )
 
+    # Running score, updated when game in lobby finishes
+    creator_wins = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    player_wins = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    draws = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    current_game_index = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    # Incremented on every change of lobby or its games, lets clients wait
+    # for the next change
+    version = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    # Order of finishing is the order ratings were updated in
+    finished_dt = sa.Column(
+        sa.DateTime,
+        nullable=True,
+    )
+
     # Relations
     creator_id = sa.Column(
         sa.Integer,
@@ -164,16 +226,162 @@ class Lobby(
     )
     lobby_status_id = sa.Column(
         sa.Integer,
-        sa.ForeignKey('lobby_status.id', ondelete='cascade'),
+        _in_enum('lobby', 'lobby_status_id', consts.LobbyStatus),
         server_default=str(consts.LobbyStatus.OPENED.value),
         nullable=False,
     )
     lobby_type_id = sa.Column(
         sa.Integer,
-        sa.ForeignKey('lobby_type.id', ondelete='cascade'),
+        _in_enum('lobby', 'lobby_type_id', consts.LobbyType),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Keyset pagination of opened lobbies
+        sa.Index(
+            'lobby_opened_status_id_idx',
+            lobby_status_id,
+            'id',
+            postgresql_where=lobby_status_id == consts.LobbyStatus.OPENED.value,
+        ),
+        # Keyset pagination of user's lobby history
+        sa.Index(
+            'lobby_creator_id_created_dt_idx',
+            creator_id,
+            'created_dt',
+            'id',
+        ),
+        sa.Index(
+            'lobby_player_id_created_dt_idx',
+            player_id,
+            'created_dt',
+            'id',
+        ),
+    )
+
+
+class UserRating(
+    mixins.Base,
+):
+    user_id = sa.Column(
+        sa.Integer,
+        sa.ForeignKey('user.id', ondelete='cascade'),
+        primary_key=True,
+        nullable=False,
+    )
+    rating = sa.Column(
+        sa.Float,
+        server_default=str(entities.ratings.INITIAL_RATING),
+        nullable=False,
+    )
+    # Rated lobbies
+    games = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Leaderboard
+        sa.Index(
+            'user_rating_rating_idx',
+            rating.desc(),
+            user_id,
+        ),
+    )
+
+
+class UserStats(
+    mixins.Base,
+):
+    user_id = sa.Column(
+        sa.Integer,
+        sa.ForeignKey('user.id', ondelete='cascade'),
+        primary_key=True,
+        nullable=False,
+    )
+    # Played games, finished without moves don't count
+    games = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    wins = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    losses = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    draws = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+
+    # Played cards, named after consts.Card
+    rock_played = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    paper_played = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    scissors_played = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    lizard_played = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    spock_played = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+
+
+class MatchmakingTicket(
+    mixins.Base,
+    mixins.BaseIntPrimaryKey,
+):
+    max_games = sa.Column(
+        sa.Integer,
+        nullable=False,
+    )
+
+    # Relations
+    user_id = sa.Column(
+        sa.Integer,
+        sa.ForeignKey('user.id', ondelete='cascade'),
+        unique=True,
+        nullable=False,
+    )
+    lobby_type_id = sa.Column(
+        sa.Integer,
+        _in_enum('matchmaking_ticket', 'lobby_type_id', consts.LobbyType),
         nullable=False,
     )
 
+    __table_args__ = (
+        # Oldest ticket of a queue
+        sa.Index(
+            'matchmaking_ticket_queue_idx',
+            lobby_type_id,
+            max_games,
+            'id',
+        ),
+    )
+
 
 class Game(
     mixins.Base,
@@ -202,23 +410,23 @@ class Game(
     )
     creator_card_id = sa.Column(
         sa.Integer,
-        sa.ForeignKey('card.id', ondelete='cascade'),
+        _in_enum('game', 'creator_card_id', consts.Card),
         nullable=True,
     )
     player_card_id = sa.Column(
         sa.Integer,
-        sa.ForeignKey('card.id', ondelete='cascade'),
+        _in_enum('game', 'player_card_id', consts.Card),
         nullable=True,
     )
     game_status_id = sa.Column(
         sa.Integer,
-        sa.ForeignKey('game_status.id', ondelete='cascade'),
+        _in_enum('game', 'game_status_id', consts.GameStatus),
         nullable=False,
         server_default=str(consts.GameStatus.PENDING.value),
     )
     game_type_id = sa.Column(
         sa.Integer,
-        sa.ForeignKey('lobby_type.id', ondelete='cascade'),
+        _in_enum('game', 'game_type_id', consts.GameType),
         nullable=False,
     )
 
@@ -239,6 +447,18 @@ class Game(
         foreign_keys=[player_id],
     )
 
+    __table_args__ = (
+        sa.Index('game_creator_id_idx', creator_id),
+        sa.Index('game_player_id_idx', player_id),
+        sa.Index(
+            'game_winner_id_idx',
+            winner_id,
+            postgresql_where=winner_id.is_not(None),
+        ),
+        # Games of lobby in order
+        sa.Index('game_lobby_id_id_idx', lobby_id, 'id'),
+    )
+
 
 class ConfirmationCode(
     mixins.BaseIntPrimaryKey,
@@ -261,7 +481,7 @@ class ConfirmationCode(
     )
     type_id = sa.Column(
         sa.Integer,
-        sa.ForeignKey('confirmation_code_type.id', ondelete='cascade'),
+        _in_enum('confirmation_code', 'type_id', consts.ConfirmationCodeType),
         nullable=False,
     )
 
@@ -272,6 +492,51 @@ class ConfirmationCode(
         foreign_keys=[phone_id],
     )
 
+    __table_args__ = (
+        # Latest code of phone
+        sa.Index('confirmation_code_phone_id_id_idx', phone_id, 'id'),
+    )
+
+
+class CallOutbox(
+    mixins.Base,
+    mixins.BaseIntPrimaryKey,
+):
+    """Confirmation code call waiting to be made by the dispatcher."""
+    attempts = sa.Column(
+        sa.Integer,
+        server_default="0",
+        nullable=False,
+    )
+    next_attempt_dt = sa.Column(
+        sa.DateTime,
+        server_default=sa.text('NOW()'),
+        nullable=False,
+    )
+    last_error = sa.Column(
+        sa.Text,
+        nullable=True,
+    )
+
+    # Relations
+    confirmation_code_id = sa.Column(
+        sa.Integer,
+        sa.ForeignKey('confirmation_code.id', ondelete='cascade'),
+        unique=True,
+        nullable=False,
+    )
+
+    # Reverse relations
+    confirmation_code = orm.relationship(
+        "models.ConfirmationCode",
+        uselist=False,
+        foreign_keys=[confirmation_code_id],
+    )
+
+    __table_args__ = (
+        sa.Index('call_outbox_next_attempt_dt_idx', next_attempt_dt),
+    )
+
 
 class Certificate(
     mixins.BaseUUIDPrimaryKey,
@@ -290,3 +555,7 @@ class Certificate(
         uselist=False,
         foreign_keys=[user_id],
     )
+
+    __table_args__ = (
+        sa.Index('certificate_user_id_idx', user_id),
+    )
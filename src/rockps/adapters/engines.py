@@ -1,16 +1,91 @@
+import time
+
+from sqlalchemy import engine as sa_engine
+from sqlalchemy import pool as sa_pool
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from rockps import settings
 
 
+class _TimedAsyncQueuePool(sa_pool.AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection.
+    """
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            Database.record_wait(time.perf_counter() - started_at)
+
+
 class Database:
     _ENGINE: AsyncEngine
+    _WAIT_STATS: dict[str, int | float]
 
     @classmethod
     def init(cls):
-        cls._ENGINE = create_async_engine(settings.DATABASE_ASYNC_URL)
+        cls._WAIT_STATS = {
+            "checkouts": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0,
+        }
+        url = sa_engine.make_url(
+            settings.DATABASE_ASYNC_URL,
+        ).update_query_dict({
+            "prepared_statement_cache_size":
+                str(settings.DATABASE_STATEMENT_CACHE_SIZE),
+        })
+        cls._ENGINE = create_async_engine(url, **cls._get_pool_options())
+
+    @staticmethod
+    def _get_pool_options() -> dict:
+        options = {
+            "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+            "connect_args": {
+                "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            },
+        }
+        # NullPool leaves pooling to an external pooler, e.g. pgbouncer in
+        # transaction mode
+        if settings.DATABASE_POOL_CLASS == "null":
+            return {**options, "poolclass": sa_pool.NullPool}
+        return {
+            **options,
+            "poolclass": _TimedAsyncQueuePool,
+            "pool_size": settings.DATABASE_POOL_SIZE,
+            "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+            "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+            "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        }
 
     @classmethod
     def get(cls):
         return cls._ENGINE
+
+    @classmethod
+    async def close(cls):
+        await cls._ENGINE.dispose()
+
+    @classmethod
+    def record_wait(cls, seconds: float):
+        cls._WAIT_STATS["checkouts"] += 1
+        cls._WAIT_STATS["total_wait"] += seconds
+        cls._WAIT_STATS["max_wait"] = max(cls._WAIT_STATS["max_wait"], seconds)
+
+    @classmethod
+    def stats(cls) -> dict[str, int | float | str]:
+        stats = {
+            "pool": settings.DATABASE_POOL_CLASS,
+            **cls._WAIT_STATS,
+        }
+        pool = cls._ENGINE.pool
+        if isinstance(pool, sa_pool.QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            })
+        return stats
@@ -0,0 +1,232 @@
+import asyncio
+import collections
+import contextlib
+import functools
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+
+import asyncpg
+import loguru
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps import settings
+from rockps.adapters import engines
+from rockps.adapters import sessions
+
+_PENDING_EVENTS = "pending_events"
+
+
+class InMemoryBus:
+    """Delivers events to subscribers of the current process only."""
+
+    def __init__(self) -> None:
+        self._queues: dict[str, set[asyncio.Queue]] = \
+            collections.defaultdict(set)
+
+    @property
+    def channels(self) -> set[str]:
+        return set(self._queues)
+
+    def deliver(self, channel: str, message: str = ""):
+        for queue in self._queues.get(channel, ()):
+            # Events only signal a change, so a subscriber that has not yet
+            # handled the previous one doesn't need another
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait(message)
+
+    def deliver_all(self):
+        """Wakes every subscriber, e.g. when events may have been missed."""
+        for channel in self.channels:
+            self.deliver(channel)
+
+    async def publish(self, channel: str, message: str = ""):
+        await self.publish_many([(channel, message)])
+
+    async def publish_many(self, events: Iterable[tuple[str, str]]):
+        for channel, message in events:
+            self.deliver(channel, message)
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        queue = asyncio.Queue(maxsize=1)
+        self._queues[channel].add(queue)
+        try:
+            yield queue
+        finally:
+            self._queues[channel].discard(queue)
+            if not self._queues[channel]:
+                del self._queues[channel]
+
+    async def close(self):
+        pass
+
+
+class PostgresBus:
+    """Delivers events to all workers through Postgres LISTEN/NOTIFY.
+
+    Each worker keeps one listening connection and LISTENs only to channels
+    that have local subscribers, which are then served by InMemoryBus. A lost
+    connection is replaced in background, after which all subscribers are
+    woken to re-read state they may have missed changes of.
+    """
+
+    def __init__(self, dsn: str) -> None:
+        self._dsn = dsn
+        self._local = InMemoryBus()
+        self._connection: asyncpg.Connection | None = None
+        # Channels LISTENed by the connection. Changed only under the lock,
+        # together with the check for local subscribers of the channel
+        self._listening: set[str] = set()
+        self._lock = asyncio.Lock()
+        self._reconnect_task: asyncio.Task | None = None
+        self._is_closed = False
+
+    def _on_notification(self, _connection, _pid, channel, payload):
+        self._local.deliver(channel, payload)
+
+    def _on_termination(self, _connection):
+        if self._is_closed or self._reconnect_task is not None:
+            return
+        loguru.logger.warning("Event bus connection is lost")
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self):
+        delay = settings.EVENT_BUS_RECONNECT_DELAY
+        try:
+            while True:
+                try:
+                    async with self._lock:
+                        await self._get_connection()
+                except Exception:  # pylint: disable=broad-except
+                    loguru.logger.exception("Event bus reconnect failed")
+                    await asyncio.sleep(delay)
+                    delay = min(
+                        delay * 2,
+                        settings.EVENT_BUS_RECONNECT_DELAY_MAX,
+                    )
+                else:
+                    break
+        finally:
+            self._reconnect_task = None
+        self._local.deliver_all()
+
+    async def _get_connection(self) -> asyncpg.Connection:
+        """Returns listening connection, opens it if needed, under lock."""
+        if self._connection is None or self._connection.is_closed():
+            self._listening.clear()
+            connection = await asyncpg.connect(self._dsn)
+            for channel in self._local.channels:
+                await connection.add_listener(channel, self._on_notification)
+            connection.add_termination_listener(self._on_termination)
+            self._connection = connection
+            self._listening.update(self._local.channels)
+        return self._connection
+
+    async def publish(self, channel: str, message: str = ""):
+        await self.publish_many([(channel, message)])
+
+    async def publish_many(self, events: Iterable[tuple[str, str]]):
+        """Sends events with one statement in one transaction."""
+        notifications = [
+            sa.func.pg_notify(channel, message) for channel, message in events
+        ]
+        if not notifications:
+            return
+        async with engines.Database.get().begin() as connection:
+            await connection.execute(sa.select(*notifications))
+
+    async def _unlisten(self, channel: str):
+        async with self._lock:
+            if channel in self._local.channels or \
+                    channel not in self._listening:
+                return
+            self._listening.discard(channel)
+            # The connection may have been replaced while subscribed
+            connection = self._connection
+            if connection is not None and not connection.is_closed():
+                await connection.remove_listener(
+                    channel,
+                    self._on_notification,
+                )
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        try:
+            async with self._local.subscribe(channel) as queue:
+                async with self._lock:
+                    connection = await self._get_connection()
+                    if channel not in self._listening:
+                        await connection.add_listener(
+                            channel,
+                            self._on_notification,
+                        )
+                        self._listening.add(channel)
+                yield queue
+        finally:
+            await self._unlisten(channel)
+
+    async def close(self):
+        self._is_closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._connection is not None:
+            await self._connection.close()
+
+
+class EventBus:
+    _BUS: InMemoryBus | PostgresBus
+
+    @classmethod
+    def init(cls):
+        if settings.EVENT_BUS_BACKEND == "memory":
+            cls._BUS = InMemoryBus()
+        else:
+            cls._BUS = PostgresBus(settings.DATABASE_SYNC_URL)
+
+    @classmethod
+    def get(cls) -> InMemoryBus | PostgresBus:
+        return cls._BUS
+
+    @classmethod
+    async def close(cls):
+        await cls._BUS.close()
+
+
+def lobby_channel(lobby_id: int) -> str:
+    return f"lobby_{lobby_id}"
+
+
+def user_channel(user_id: int) -> str:
+    return f"user_{user_id}"
+
+
+async def publish(channel: str, message: str = ""):
+    await EventBus.get().publish(channel, message)
+
+
+def publish_after_commit(
+    session: AsyncSession,
+    channel: str,
+    message: str = "",
+):
+    """Publishes the event once the session is committed.
+
+    Events of one commit are sent together, and repeated ones only once.
+    """
+    pending = session.info.get(_PENDING_EVENTS)
+    if pending is None:
+        pending = session.info[_PENDING_EVENTS] = {}
+        sessions.call_after_commit(
+            session,
+            functools.partial(_publish_pending, session),
+        )
+    pending[(channel, message)] = None
+
+
+async def _publish_pending(session: AsyncSession):
+    await EventBus.get().publish_many(session.info.pop(_PENDING_EVENTS, {}))
+
+
+def subscribe(channel: str):
+    return EventBus.get().subscribe(channel)
@@ -0,0 +1,92 @@
+import asyncio
+from concurrent import futures
+
+import bcrypt
+
+from rockps import settings
+
+_EXECUTOR_CLASSES = {
+    "thread": futures.ThreadPoolExecutor,
+    "process": futures.ProcessPoolExecutor,
+}
+
+
+def hash_password(password: str) -> bytes:
+    return bcrypt.hashpw(
+        password=bytes(password, "ascii"),
+        salt=bcrypt.gensalt(),
+    )
+
+
+def check_password(password: str, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(
+        password=bytes(password, "ascii"),
+        hashed_password=hashed_password,
+    )
+
+
+class PasswordHasher:
+    """Runs bcrypt in a worker pool so it doesn't block the event loop.
+
+    At most PASSWORD_HASHER_MAX_CONCURRENCY calls are handed to the pool at
+    once, the rest wait on the semaphore and are counted as queued.
+    """
+    _EXECUTOR: futures.Executor
+    _SEMAPHORE: asyncio.Semaphore
+    _STATS: dict[str, int]
+
+    @classmethod
+    def init(cls):
+        executor_class = _EXECUTOR_CLASSES[settings.PASSWORD_HASHER_EXECUTOR]
+        cls._EXECUTOR = executor_class(
+            max_workers=settings.PASSWORD_HASHER_WORKERS,
+        )
+        cls._SEMAPHORE = asyncio.Semaphore(
+            settings.PASSWORD_HASHER_MAX_CONCURRENCY,
+        )
+        cls._STATS = {
+            "queued": 0,
+            "max_queued": 0,
+            "running": 0,
+            "completed": 0,
+        }
+
+    @classmethod
+    def shutdown(cls):
+        cls._EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def stats(cls) -> dict[str, int | str]:
+        return {
+            "executor": settings.PASSWORD_HASHER_EXECUTOR,
+            "workers": settings.PASSWORD_HASHER_WORKERS,
+            "max_concurrency": settings.PASSWORD_HASHER_MAX_CONCURRENCY,
+            **cls._STATS,
+        }
+
+    @classmethod
+    async def _run(cls, func, *args):
+        stats = cls._STATS
+        stats["queued"] += 1
+        stats["max_queued"] = max(stats["max_queued"], stats["queued"])
+        try:
+            await cls._SEMAPHORE.acquire()
+        finally:
+            stats["queued"] -= 1
+
+        stats["running"] += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(cls._EXECUTOR, func, *args)
+        finally:
+            stats["running"] -= 1
+            stats["completed"] += 1
+            cls._SEMAPHORE.release()
+
+    @classmethod
+    async def hash(cls, password: str) -> bytes:
+        return await cls._run(hash_password, password)
+
+    @classmethod
+    async def check(cls, password: str, hashed_password: bytes) -> bool:
+        return await cls._run(check_password, password, hashed_password)
@@ -0,0 +1,32 @@
+import bisect
+from collections.abc import Sequence
+
+
+class Histogram:
+    """Counts observed values into buckets of given upper bounds."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = sorted(buckets)
+        self.count = 0
+        self.sum = 0.0
+        # Last counter is for values above the greatest bound
+        self._counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def stats(self) -> dict:
+        """Returns cumulative counts like Prometheus histograms do."""
+        buckets = {}
+        total = 0
+        for bound, count in zip(self.buckets, self._counts):
+            total += count
+            buckets[str(bound)] = total
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": buckets,
+        }
@@ -0,0 +1,235 @@
+import asyncio
+import datetime
+
+import loguru
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps import consts
+from rockps import settings
+from rockps.adapters import engines
+from rockps.adapters import events
+from rockps.adapters import sessions
+from rockps.adapters.db import models
+
+LOCK_NAME = "rockps_janitor"
+
+
+def _older_than(column, seconds: float):
+    return column < sa.func.now() - datetime.timedelta(seconds=seconds)
+
+
+class Janitor:
+    """Deletes or cancels expired rows in background.
+
+    Runs every JANITOR_INTERVAL seconds on the worker that takes the
+    advisory lock, the others skip the run. Rows are handled in batches of
+    JANITOR_BATCH_SIZE, one transaction each, so locks are held briefly.
+    """
+    _TASK: asyncio.Task | None = None
+    _STATS: dict
+
+    @classmethod
+    def start(cls):
+        cls._STATS = {
+            "runs": 0,
+            "skipped": 0,
+            "last_run": {},
+            "reclaimed": {
+                "confirmation_codes": 0,
+                "certificates": 0,
+                "lobbies": 0,
+            },
+        }
+        cls._TASK = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls):
+        if cls._TASK is not None:
+            cls._TASK.cancel()
+            try:
+                await cls._TASK
+            except asyncio.CancelledError:
+                pass
+            cls._TASK = None
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {
+            **cls._STATS,
+            "reclaimed": dict(cls._STATS["reclaimed"]),
+        }
+
+    @classmethod
+    async def _run(cls):
+        while True:
+            await asyncio.sleep(settings.JANITOR_INTERVAL)
+            try:
+                await cls.sweep()
+            except Exception:  # pylint: disable=broad-except
+                loguru.logger.exception("Janitor run failed")
+
+    @classmethod
+    async def sweep(cls) -> dict[str, int] | None:
+        """Runs cleanup if no other worker does, returns reclaimed rows."""
+        lock_key = sa.func.hashtext(LOCK_NAME)
+        async with engines.Database.get().connect() as connection:
+            # Session-level lock is kept after commit, which ends the
+            # transaction so the connection doesn't idle in it
+            is_leader = await connection.scalar(
+                sa.select(sa.func.pg_try_advisory_lock(lock_key)),
+            )
+            await connection.commit()
+            if not is_leader:
+                cls._STATS["skipped"] += 1
+                return None
+            try:
+                reclaimed = {
+                    "confirmation_codes": await cls._drain(
+                        cls._delete_confirmation_codes,
+                    ),
+                    "certificates": await cls._drain(
+                        cls._delete_certificates,
+                    ),
+                    "lobbies": await cls._drain(cls._cancel_lobbies),
+                }
+            finally:
+                await connection.execute(
+                    sa.select(sa.func.pg_advisory_unlock(lock_key)),
+                )
+                await connection.commit()
+
+        cls._STATS["runs"] += 1
+        cls._STATS["last_run"] = reclaimed
+        for name, count in reclaimed.items():
+            cls._STATS["reclaimed"][name] += count
+        if any(reclaimed.values()):
+            loguru.logger.info("Janitor reclaimed {}", reclaimed)
+        return reclaimed
+
+    @classmethod
+    async def _drain(cls, handle_batch) -> int:
+        total = 0
+        while True:
+            async with sessions.get_session_class()() as session:
+                count = await handle_batch(session)
+                await session.commit()
+            await sessions.run_after_commit(session)
+            total += count
+            if count < settings.JANITOR_BATCH_SIZE:
+                return total
+
+    @classmethod
+    async def _delete_confirmation_codes(cls, session: AsyncSession) -> int:
+        expired_ids = sa.select(
+            models.ConfirmationCode.id,
+        ).where(
+            _older_than(
+                models.ConfirmationCode.created_dt,
+                settings.CONFIRMATION_CODE_TTL,
+            ),
+        ).order_by(
+            models.ConfirmationCode.id,
+        ).limit(
+            settings.JANITOR_BATCH_SIZE,
+        ).with_for_update(
+            skip_locked=True,
+        ).scalar_subquery()
+        result = await session.execute(
+            sa.delete(
+                models.ConfirmationCode,
+            ).where(
+                models.ConfirmationCode.id.in_(expired_ids),
+            ).returning(
+                models.ConfirmationCode.id,
+            )
+        )
+        return len(result.all())
+
+    @classmethod
+    async def _delete_certificates(cls, session: AsyncSession) -> int:
+        expired_ids = sa.select(
+            models.Certificate.id,
+        ).where(
+            _older_than(
+                models.Certificate.created_dt,
+                settings.CERTIFICATE_TTL,
+            ),
+        ).limit(
+            settings.JANITOR_BATCH_SIZE,
+        ).with_for_update(
+            skip_locked=True,
+        ).scalar_subquery()
+        result = await session.execute(
+            sa.delete(
+                models.Certificate,
+            ).where(
+                models.Certificate.id.in_(expired_ids),
+            ).returning(
+                models.Certificate.id,
+            )
+        )
+        return len(result.all())
+
+    @classmethod
+    async def _cancel_lobbies(cls, session: AsyncSession) -> int:
+        """Cancels lobbies nobody joined for OPENED_LOBBY_TTL seconds."""
+        stale_ids = sa.select(
+            models.Lobby.id,
+        ).where(
+            models.Lobby.lobby_status_id == consts.LobbyStatus.OPENED.value,
+            _older_than(models.Lobby.created_dt, settings.OPENED_LOBBY_TTL),
+        ).order_by(
+            models.Lobby.id,
+        ).limit(
+            settings.JANITOR_BATCH_SIZE,
+        ).with_for_update(
+            skip_locked=True,
+        ).scalar_subquery()
+        result = await session.execute(
+            sa.update(
+                models.Lobby,
+            ).where(
+                models.Lobby.id.in_(stale_ids),
+            ).values(
+                lobby_status_id=consts.LobbyStatus.CANCELED.value,
+                version=models.Lobby.version + 1,
+            ).returning(
+                models.Lobby.id,
+            ).execution_options(
+                synchronize_session=False,
+            )
+        )
+        lobby_ids = result.scalars().all()
+        if not lobby_ids:
+            return 0
+
+        await session.execute(
+            sa.update(
+                models.Game,
+            ).where(
+                models.Game.lobby_id.in_(lobby_ids),
+                models.Game.game_status_id.in_((
+                    consts.GameStatus.ACTIVE,
+                    consts.GameStatus.PENDING,
+                )),
+            ).values(
+                game_status_id=consts.GameStatus.CANCELED.value,
+            ).execution_options(
+                synchronize_session=False,
+            )
+        )
+        await session.execute(
+            sa.update(
+                models.User,
+            ).where(
+                models.User.current_lobby_id.in_(lobby_ids),
+            ).values(
+                current_lobby_id=None,
+            ).execution_options(
+                synchronize_session=False,
+            )
+        )
+        for lobby_id in lobby_ids:
+            events.publish_after_commit(session, events.lobby_channel(lobby_id))
+        return len(lobby_ids)
@@ -0,0 +1,218 @@
+import asyncio
+import datetime
+
+import loguru
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps import settings
+from rockps.adapters import breakers
+from rockps.adapters import events
+from rockps.adapters import sessions
+from rockps.adapters.db import models
+from rockps.adapters.services.external import call
+
+CALL_CHANNEL = "call_outbox"
+
+
+def enqueue_call(session: AsyncSession, confirmation_code):
+    """Schedules a call with the code, made once the session is committed.
+    """
+    session.add(models.CallOutbox(confirmation_code=confirmation_code))
+    events.publish_after_commit(session, CALL_CHANNEL)
+
+
+class CallOutbox:
+    """Makes calls of call_outbox in background.
+
+    Claimed calls are leased for CALL_OUTBOX_LEASE seconds instead of being
+    locked, so no transaction is held open during HTTP requests, and calls
+    of a crashed dispatcher are retried once their lease expires. With
+    CALL_OUTBOX_ENABLED off, calls are made only by explicit dispatch().
+    """
+    _TASK: asyncio.Task | None = None
+    _STATS: dict[str, int]
+
+    @classmethod
+    def start(cls):
+        cls._STATS = {"sent": 0, "retried": 0, "postponed": 0, "failed": 0}
+        if settings.CALL_OUTBOX_ENABLED:
+            cls._TASK = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls):
+        if cls._TASK is not None:
+            cls._TASK.cancel()
+            try:
+                await cls._TASK
+            except asyncio.CancelledError:
+                pass
+            cls._TASK = None
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return dict(cls._STATS)
+
+    @classmethod
+    async def _run(cls):
+        async with events.subscribe(CALL_CHANNEL) as queue:
+            while True:
+                try:
+                    claimed = await cls.dispatch()
+                except Exception:  # pylint: disable=broad-except
+                    loguru.logger.exception("Call outbox dispatch failed")
+                    claimed = 0
+                # Full batch means there may be more calls waiting
+                if claimed < settings.CALL_OUTBOX_CONCURRENCY:
+                    try:
+                        await asyncio.wait_for(
+                            queue.get(),
+                            timeout=settings.CALL_OUTBOX_POLL_INTERVAL,
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+
+    @classmethod
+    async def dispatch(cls) -> int:
+        """Makes a batch of due calls concurrently, returns its size."""
+        async with sessions.get_session_class()() as session:
+            claimed = await cls._claim(session)
+            await session.commit()
+        await asyncio.gather(*(cls._send(*row) for row in claimed))
+        return len(claimed)
+
+    @classmethod
+    async def _claim(cls, session: AsyncSession) -> list[tuple]:
+        due_ids = sa.select(
+            models.CallOutbox.id,
+        ).where(
+            models.CallOutbox.next_attempt_dt <= sa.func.now(),
+        ).order_by(
+            models.CallOutbox.next_attempt_dt,
+        ).limit(
+            settings.CALL_OUTBOX_CONCURRENCY,
+        ).with_for_update(
+            skip_locked=True,
+        ).scalar_subquery()
+        # Core table, as ORM UPDATE can't be used as CTE
+        outbox = models.CallOutbox.__table__
+        claimed = sa.update(
+            outbox,
+        ).where(
+            outbox.c.id.in_(due_ids),
+        ).values(
+            attempts=outbox.c.attempts + 1,
+            next_attempt_dt=sa.func.now() + datetime.timedelta(
+                seconds=settings.CALL_OUTBOX_LEASE,
+            ),
+        ).returning(
+            outbox.c.id,
+            outbox.c.attempts,
+            outbox.c.confirmation_code_id,
+        ).cte()
+        result = await session.execute(
+            sa.select(
+                claimed.c.id,
+                claimed.c.attempts,
+                claimed.c.confirmation_code_id,
+                models.Phone.number,
+                models.ConfirmationCode.value,
+            ).join(
+                models.ConfirmationCode,
+                models.ConfirmationCode.id == claimed.c.confirmation_code_id,
+            ).join(
+                models.Phone,
+                models.Phone.id == models.ConfirmationCode.phone_id,
+            )
+        )
+        return result.all()
+
+    @classmethod
+    async def _send(
+        cls,
+        outbox_id: int,
+        attempts: int,
+        confirmation_code_id: int,
+        number: str,
+        code: str,
+    ):  # pylint: disable=too-many-arguments
+        try:
+            call_id = await call.call(number, code)
+        except breakers.CircuitOpenError as e:
+            await cls._postpone(outbox_id, e.retry_after)
+            return
+        except Exception as e:  # pylint: disable=broad-except
+            await cls._retry_or_drop(outbox_id, attempts, repr(e))
+            return
+
+        async with sessions.get_session_class()() as session:
+            await session.execute(
+                sa.update(
+                    models.ConfirmationCode,
+                ).where(
+                    models.ConfirmationCode.id == confirmation_code_id,
+                ).values(
+                    call_id=call_id,
+                )
+            )
+            await session.execute(
+                sa.delete(
+                    models.CallOutbox,
+                ).where(
+                    models.CallOutbox.id == outbox_id,
+                )
+            )
+            await session.commit()
+        cls._STATS["sent"] += 1
+
+    @classmethod
+    async def _postpone(cls, outbox_id: int, delay: float):
+        """Hides the call until the circuit closes, keeping its attempt."""
+        async with sessions.get_session_class()() as session:
+            await session.execute(
+                sa.update(
+                    models.CallOutbox,
+                ).where(
+                    models.CallOutbox.id == outbox_id,
+                ).values(
+                    attempts=models.CallOutbox.attempts - 1,
+                    next_attempt_dt=sa.func.now() + datetime.timedelta(
+                        seconds=delay,
+                    ),
+                )
+            )
+            await session.commit()
+        cls._STATS["postponed"] += 1
+
+    @classmethod
+    async def _retry_or_drop(cls, outbox_id: int, attempts: int, error: str):
+        async with sessions.get_session_class()() as session:
+            if attempts >= settings.CALL_OUTBOX_MAX_ATTEMPTS:
+                loguru.logger.error(
+                    "Call {} failed {} times, dropped: {}",
+                    outbox_id, attempts, error,
+                )
+                statement = sa.delete(
+                    models.CallOutbox,
+                ).where(
+                    models.CallOutbox.id == outbox_id,
+                )
+                cls._STATS["failed"] += 1
+            else:
+                loguru.logger.warning(
+                    "Call {} failed, retrying: {}", outbox_id, error,
+                )
+                delay = settings.CALL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+                statement = sa.update(
+                    models.CallOutbox,
+                ).where(
+                    models.CallOutbox.id == outbox_id,
+                ).values(
+                    next_attempt_dt=sa.func.now() + datetime.timedelta(
+                        seconds=delay,
+                    ),
+                    last_error=error,
+                )
+                cls._STATS["retried"] += 1
+            await session.execute(statement)
+            await session.commit()
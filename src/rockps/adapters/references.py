@@ -0,0 +1,40 @@
+import sqlalchemy as sa
+
+from rockps import consts
+from rockps.adapters import sessions
+from rockps.adapters.db import models
+
+_LOOKUP_MODELS = {
+    consts.Card: models.Card,
+    consts.LobbyStatus: models.LobbyStatus,
+    consts.LobbyType: models.LobbyType,
+    consts.GameStatus: models.GameStatus,
+    consts.GameType: models.GameType,
+    consts.ConfirmationCodeType: models.ConfirmationCodeType,
+}
+
+
+class ReferenceDataDrift(RuntimeError):
+    pass
+
+
+async def verify():
+    """Checks ids of lookup tables against consts, run once at startup.
+
+    Lookup columns have no FKs, only CHECKs on consts values, so ids of
+    consts must match the tables exactly. Names are only for display and
+    may be spelled differently.
+    """
+    drift = []
+    async with sessions.get_session_class()() as session:
+        for enum, model in _LOOKUP_MODELS.items():
+            ids = set(await session.scalars(sa.select(model.id)))
+            if ids != set(enum.values()):
+                drift.append(
+                    f"{model.__tablename__}: {sorted(ids)} != "
+                    f"{sorted(enum.values())}"
+                )
+    if drift:
+        raise ReferenceDataDrift(
+            "Lookup tables differ from consts: " + "; ".join(drift)
+        )
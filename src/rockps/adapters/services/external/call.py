@@ -1,26 +1,32 @@
+import asyncio
 import hashlib
+import itertools
 import json
 import time
 
 import httpx
 
 from rockps import settings
+from rockps.adapters import breakers
 from rockps.adapters import clients
 
-_CLIENT = None
+BREAKER = breakers.CircuitBreaker(
+    failure_threshold=settings.CALL_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.CALL_BREAKER_RECOVERY_TIMEOUT,
+    failure_types=(httpx.HTTPError,),
+)
+RETRY_BUDGET = breakers.RetryBudget(
+    ratio=settings.CALL_RETRY_BUDGET_RATIO,
+    max_tokens=settings.CALL_RETRY_BUDGET_MAX_TOKENS,
+)
+# Request wasn't sent, so retry can't make a second call
+RETRIABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
 
 
 def dumps_minimized(obj):
     return json.dumps(obj, separators=(',', ':'))
 
 
-async def _get_session():
-    global _CLIENT
-    if _CLIENT is None:
-        _CLIENT = clients.Httpx()
-    return _CLIENT
-
-
 def _raise_for_error_responce(func):
     async def wrapper(*args, **kwargs):
         try:
@@ -38,6 +44,33 @@ def _raise_for_error_responce(func):
     return wrapper
 
 
+def _guard(func):
+    """Fails fast while the service is down and retries lost connections."""
+    async def wrapper(*args, **kwargs):
+        RETRY_BUDGET.deposit()
+        for attempt in itertools.count():
+            try:
+                with BREAKER:
+                    return await func(*args, **kwargs)
+            except RETRIABLE_ERRORS:
+                if attempt >= settings.CALL_RETRY_ATTEMPTS or \
+                        not RETRY_BUDGET.withdraw():
+                    raise
+            await asyncio.sleep(breakers.backoff(
+                attempt,
+                base=settings.CALL_RETRY_BACKOFF,
+                cap=settings.CALL_RETRY_BACKOFF_MAX,
+            ))
+    return wrapper
+
+
+def stats() -> dict:
+    return {
+        "breaker": BREAKER.stats(),
+        "retry_budget": RETRY_BUDGET.stats(),
+    }
+
+
 def _get_request_signature(endpoint, params):
     timestamp = str(int(time.time()))
     signature_content = [
@@ -52,20 +85,21 @@ def _get_request_signature(endpoint, params):
     return f"{settings.NEWTEL_API_KEY}{timestamp}{signature}"
 
 
+@_guard
 @_raise_for_error_responce
 async def _request(endpoint: str, data: dict):
-    url = f"https://api.new-tel.net/{endpoint}"
     signature = _get_request_signature(endpoint, data)
     headers = {
         "Authorization": f"Bearer {signature}",
         "Content-Type": "application/json",
     }
-    session = await _get_session()
-    response = await session.post(
-        url=url,
+    response = await clients.HttpClients.get("newtel").post(
+        url=endpoint,
         data=dumps_minimized(data),
         headers=headers,
     )
+    if response.is_server_error:
+        response.raise_for_status()
     return response.json()
 
 
@@ -1,29 +1,94 @@
+import time
 from collections.abc import AsyncGenerator
+from collections.abc import Awaitable
+from collections.abc import Callable
 
-from sqlalchemy import orm
+import loguru
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from rockps.adapters import engines
 
+_AFTER_COMMIT = "after_commit"
 
-def get_session_class():
-    engine = engines.Database.get()
-    return orm.sessionmaker(
-        engine,
-        expire_on_commit=False,
-        class_=AsyncSession,
-    )
+
+class SessionFactory:
+    _FACTORY: async_sessionmaker[AsyncSession]
+    _STATS: dict[str, int | float]
+
+    @classmethod
+    def init(cls):
+        cls._FACTORY = async_sessionmaker(
+            engines.Database.get(),
+            expire_on_commit=False,
+        )
+        cls._STATS = {
+            "opened": 0,
+            "active": 0,
+            "total_lifetime": 0.0,
+            "max_lifetime": 0.0,
+        }
+
+    @classmethod
+    def get(cls) -> async_sessionmaker[AsyncSession]:
+        return cls._FACTORY
+
+    @classmethod
+    def record_open(cls):
+        cls._STATS["opened"] += 1
+        cls._STATS["active"] += 1
+
+    @classmethod
+    def record_close(cls, lifetime: float):
+        cls._STATS["active"] -= 1
+        cls._STATS["total_lifetime"] += lifetime
+        cls._STATS["max_lifetime"] = max(cls._STATS["max_lifetime"], lifetime)
+
+    @classmethod
+    def stats(cls) -> dict[str, int | float]:
+        return dict(cls._STATS)
+
+
+def get_session_class() -> async_sessionmaker[AsyncSession]:
+    return SessionFactory.get()
+
+
+def call_after_commit(
+    session: AsyncSession,
+    callback: Callable[[], Awaitable],
+):
+    """Schedules callback to run once the session is committed.
+
+    create_session runs callbacks itself, other owners of a session call
+    run_after_commit after commit.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession):
+    """Runs callbacks scheduled by call_after_commit, once."""
+    for callback in session.info.pop(_AFTER_COMMIT, ()):
+        try:
+            await callback()
+        except Exception:  # pylint: disable=broad-except
+            loguru.logger.exception("After commit callback failed")
 
 
 async def create_session() -> AsyncGenerator[AsyncSession, None]:
-    session_class = get_session_class()
-    session: AsyncSession = session_class()
+    # FastAPI caches dependencies per request, so every dependency of one
+    # request that depends on create_session gets this same session
+    session: AsyncSession = get_session_class()()
+    SessionFactory.record_open()
+    opened_at = time.perf_counter()
 
     try:
         yield session
     except Exception as e:
         await session.rollback()
-        await session.close()
         raise e
-    await session.commit()
-    await session.close()
+    else:
+        await session.commit()
+    finally:
+        await session.close()
+        SessionFactory.record_close(time.perf_counter() - opened_at)
+    await run_after_commit(session)
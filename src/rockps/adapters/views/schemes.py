@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import datetime
 import uuid
 from typing import Generic
 from typing import TypeVar
 
 import pydantic
+from pydantic import generics
 from pydantic import validator
 
 from rockps import consts
@@ -62,22 +64,62 @@ class LobbyPost(Base):
         return value
 
 
+class MatchmakingPost(Base):
+    max_games: int = pydantic.Field(ge=1, le=5)
+    lobby_type_id: consts.LobbyType
+
+    @validator("max_games")
+    @classmethod
+    def max_games_must_be_odd(cls, value):
+        if value % 2 == 0:
+            raise ValueError(texts.MAX_GAMES_MUST_BE_ODD)
+        return value
+
+
+class MatchmakingGet(Base):
+    lobby_id: int | None
+
+
+class RatingGet(Base):
+    user_id: int
+    nickname: str
+    rating: float
+    games: int
+
+
 class ConfirmationCode(Base):
     username: str = pydantic.Field()
     code: str = pydantic.Field()
 
 
+class UserStatsGet(Base):
+    games: int = 0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    rock_played: int = 0
+    paper_played: int = 0
+    scissors_played: int = 0
+    lizard_played: int = 0
+    spock_played: int = 0
+
+
 class UserGet(Base):
     id: int
     nickname: str = pydantic.Field(min_length=2, max_length=128)
     current_lobby_id: int | None
 
 
+class UserProfileGet(UserGet):
+    stats: UserStatsGet
+
+
 class LobbyGet(Base):
     id: int
     name: str
     max_games: int
     lobby_type_id: consts.LobbyType
+    creator_nickname: str | None
 
 
 class SuccessSignIn(Base):
@@ -120,7 +162,40 @@ class ResetPasswordRequest(Base):
 _PAGE_ITEM = TypeVar('_PAGE_ITEM')
 
 
-class Page(Base, Generic[_PAGE_ITEM]):
+class Page(Base, generics.GenericModel, Generic[_PAGE_ITEM]):
     items: list[_PAGE_ITEM]
     total: int
     size: int
+    # Keyset cursor of the next page, None on the last one
+    next_id: int | None
+
+
+class HistoryGameGet(Base):
+    id: int
+    game_status_id: consts.GameStatus
+    creator_card_id: consts.Card | None
+    player_card_id: consts.Card | None
+    winner_id: int | None
+
+
+class HistoryLobbyGet(Base):
+    id: int
+    name: str
+    created_dt: datetime.datetime
+    max_games: int
+    lobby_type_id: consts.LobbyType
+    lobby_status_id: consts.LobbyStatus
+    creator_id: int
+    player_id: int | None
+    creator_wins: int
+    player_wins: int
+    draws: int
+    games: list[HistoryGameGet]
+
+
+class HistoryPage(Base):
+    items: list[HistoryLobbyGet]
+    size: int
+    # Keyset cursor of the next page, None on the last one
+    next_created_dt: datetime.datetime | None
+    next_id: int | None
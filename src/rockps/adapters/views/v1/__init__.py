@@ -1,4 +1,8 @@
 from rockps.adapters.views.v1 import auth
+from rockps.adapters.views.v1 import etags
 from rockps.adapters.views.v1 import game
+from rockps.adapters.views.v1 import leaderboard
 from rockps.adapters.views.v1 import lobby
+from rockps.adapters.views.v1 import matchmaking
+from rockps.adapters.views.v1 import metrics
 from rockps.adapters.views.v1 import user
@@ -1,23 +1,49 @@
+import hashlib
+import secrets
+
 import fastapi
 import jose
 import sqlalchemy.ext.asyncio as sa_asyncio
 from fastapi import security
 from jose import jwt
+from sqlalchemy import orm
 
 from rockps import settings
 from rockps import texts
+from rockps.adapters import caches
 from rockps.adapters import models
 from rockps.adapters import sessions
 
 OAUTH2_SCHEME = security.OAuth2PasswordBearer(tokenUrl="/api/v1/auth/signin")
+METRICS_SCHEME = security.HTTPBearer(auto_error=False)
+TOKEN_CACHE = caches.TTLCache(maxsize=settings.TOKEN_CACHE_SIZE)
 
 
-async def get_user(
-    token: str = fastapi.Depends(OAUTH2_SCHEME),
-    session: sa_asyncio.AsyncSession = fastapi.Depends(
-        sessions.create_session
-    ),
-):
+def decode_token_subject(token: str) -> str | None:
+    """Returns token's subject, verifying the signature only on cache miss.
+
+    Raises jose.JWTError for invalid tokens. Verified subjects are cached by
+    token digest until the token expires.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    if (subject := TOKEN_CACHE.get(key)) is not None:
+        return subject
+
+    payload = jwt.decode(
+        token,
+        settings.SECRET_KEY,
+        algorithms=[settings.JWT_ALGORITHM]
+    )
+    subject = payload.get("sub")
+    if subject is not None and "exp" in payload:
+        TOKEN_CACHE.set(key, subject, expires_at=payload["exp"])
+    return subject
+
+
+async def authenticate(
+    token: str,
+    session: sa_asyncio.AsyncSession,
+) -> models.User:
     credentials_exception = fastapi.HTTPException(
         status_code=fastapi.status.HTTP_401_UNAUTHORIZED,
         detail=[{
@@ -28,30 +54,60 @@ async def get_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        user_id = decode_token_subject(token)
     except jose.JWTError:
         raise credentials_exception  # pylint: disable=raise-missing-from
-    if (user_id := payload.get("sub")) is None:
+    if user_id is None:
         raise credentials_exception
     if not user_id.isdigit():
         raise credentials_exception
-    if (user := await session.get(models.User, int(user_id))) is None:
+    # Phone is joined here so get_confirmed_user doesn't need a second query
+    user = await session.get(
+        models.User,
+        int(user_id),
+        options=[orm.joinedload(models.User.phone, innerjoin=True)],
+    )
+    if user is None:
         raise credentials_exception
     return user
 
 
-async def get_confirmed_user(
-    user: models.User = fastapi.Depends(get_user),
+async def get_user(
+    token: str = fastapi.Depends(OAUTH2_SCHEME),
     session: sa_asyncio.AsyncSession = fastapi.Depends(
         sessions.create_session
     ),
 ):
-    phone = await session.get(models.Phone, user.phone_id)
-    if not phone.is_confirmed:
+    return await authenticate(token, session)
+
+
+async def verify_metrics_token(
+    credentials: security.HTTPAuthorizationCredentials | None =
+        fastapi.Depends(METRICS_SCHEME),
+):
+    """Lets monitoring with METRICS_TOKEN read internal metrics."""
+    if not settings.METRICS_TOKEN:
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_404_NOT_FOUND,
+        )
+    if credentials is None or not secrets.compare_digest(
+            credentials.credentials.encode(),
+            settings.METRICS_TOKEN.encode()):
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_401_UNAUTHORIZED,
+            detail=[{
+                "loc": ["header", "Authorization"],
+                "msg": texts.COULD_NOT_VALIDATE_CREDITS,
+                "type": "validation_error",
+            }],
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_confirmed_user(
+    user: models.User = fastapi.Depends(get_user),
+):
+    if not user.phone.is_confirmed:
         raise fastapi.HTTPException(
             status_code=400,
             detail=[{
@@ -3,7 +3,7 @@ import sqlalchemy.ext.asyncio as sa_asyncio
 
 from rockps import cases
 from rockps.adapters import models
-from rockps.adapters import services
+from rockps.adapters import outbox
 from rockps.adapters import sessions
 from rockps.adapters.views import schemes
 
@@ -21,7 +21,7 @@ class Confirm:
     ):
         case = cases.auth.Confirm(
             confirmation_code_model=models.ConfirmationCode,
-            call_service=services.external.call,
+            call_service=outbox,
             phone_model=models.Phone,
             data=code.dict(),
             session=session,
@@ -5,7 +5,7 @@ import sqlalchemy.ext.asyncio as sa_asyncio
 
 from rockps import cases
 from rockps.adapters import models
-from rockps.adapters import services
+from rockps.adapters import outbox
 from rockps.adapters import sessions
 from rockps.adapters.views import schemes
 
@@ -30,7 +30,7 @@ class ResetPasswordCertify:
             confirmation_code_model=models.ConfirmationCode,
             certificate_model=models.Certificate,
             phone_model=models.Phone,
-            call_service=services.external.call,
+            call_service=outbox,
             data=code.dict(),
         )
         result = await case.execute()
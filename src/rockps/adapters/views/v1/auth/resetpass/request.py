@@ -2,8 +2,9 @@ import fastapi
 import sqlalchemy.ext.asyncio as sa_asyncio
 
 from rockps import cases
+from rockps import settings
 from rockps.adapters import models
-from rockps.adapters import services
+from rockps.adapters import outbox
 from rockps.adapters import sessions
 from rockps.adapters.views import schemes
 
@@ -21,7 +22,9 @@ class ResetPassRequest:
     ):
         case = cases.auth.ResetPasswordRequest(
             session=session,
-            call_service=services.external.call,
+            call_service=outbox,
+            call_outbox_model=models.CallOutbox,
+            code_cooldown=settings.CONFIRMATION_CODE_COOLDOWN,
             confirmation_code_model=models.ConfirmationCode,
             phone_model=models.Phone,
             data=req.dict(),
@@ -2,8 +2,9 @@ import fastapi
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from rockps import cases
+from rockps import settings
 from rockps.adapters import models
-from rockps.adapters import services
+from rockps.adapters import outbox
 from rockps.adapters import sessions
 from rockps.adapters.views import schemes
 
@@ -20,7 +21,9 @@ class SignUp:
         ),
     ):
         case = cases.auth.SignUp(
-            call_service=services.external.call,
+            call_service=outbox,
+            call_outbox_model=models.CallOutbox,
+            code_cooldown=settings.CONFIRMATION_CODE_COOLDOWN,
             session=session,
             phone_model=models.Phone,
             user_model=models.User,
@@ -0,0 +1,31 @@
+import hashlib
+
+import fastapi
+
+
+def make_etag(*parts) -> str:
+    """Returns weak ETag built from parts that identify response content."""
+    digest = hashlib.blake2b(
+        ":".join(map(str, parts)).encode(),
+        digest_size=8,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: fastapi.Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as ETag may come back without W/ prefix
+    return etag.removeprefix("W/") in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str, **headers: str) -> fastapi.Response:
+    return fastapi.Response(
+        status_code=fastapi.status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, **headers},
+    )
@@ -1,3 +1,6 @@
+import asyncio
+import contextlib
+
 import fastapi
 import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_asyncio
@@ -5,11 +8,14 @@ from sqlalchemy import orm as sa_orm
 
 from rockps import cases
 from rockps import consts
+from rockps import settings
 from rockps import texts
+from rockps.adapters import events
 from rockps.adapters import models
 from rockps.adapters import sessions
 from rockps.adapters.views import schemes
 from rockps.adapters.views.v1 import access
+from rockps.adapters.views.v1 import etags
 
 
 class Game:
@@ -48,6 +54,10 @@ class Game:
 
         case = cases.UpdateGame(
             model=models.Game,
+            lobby_model=models.Lobby,
+            rating_model=models.UserRating,
+            stats_model=models.UserStats,
+            event_service=events,
             data={
                 "id": game_data.id,
                 "user_id": requesting_user.id,
@@ -67,6 +77,9 @@ class Game:
     @staticmethod
     @router.get("/", response_model=list[schemes.GameGet])
     async def get(
+        request: fastapi.Request,
+        response: fastapi.Response,
+        since_version: int | None = fastapi.Query(None, ge=0),
         requesting_user: models.User = fastapi.Depends(
             access.get_confirmed_user
         ),
@@ -74,6 +87,13 @@ class Game:
             sessions.create_session
         ),
     ):
+        """Returns games of user's current lobby.
+
+        If since_version is passed and lobby version is still the same, waits
+        for the next change of lobby up to GAME_LONG_POLL_TIMEOUT seconds.
+        Lobby version is returned in X-Lobby-Version header, responds with
+        304 if games haven't changed since the version in If-None-Match.
+        """
         if not requesting_user.current_lobby_id:
             raise fastapi.HTTPException(
                 status_code=fastapi.status.HTTP_400_BAD_REQUEST,
@@ -84,54 +104,213 @@ class Game:
                 }],
             )
 
-        result = await session.execute(
-            sa.select(
-                models.Game,
-            ).where(
-                models.Game.lobby_id == requesting_user.current_lobby_id,
-            ).order_by(
-                models.Game.id,
-            ).options(
-                sa_orm.joinedload(models.Game.creator),
-                sa_orm.joinedload(models.Game.player),
+        lobby_id = requesting_user.current_lobby_id
+        if since_version is None:
+            version = await _get_lobby_version(session, lobby_id)
+        else:
+            version = await _wait_for_lobby_version(
+                session,
+                lobby_id,
+                since_version,
             )
+        etag = etags.make_etag(lobby_id, version, requesting_user.id)
+        if etags.is_not_modified(request, etag):
+            return etags.not_modified(etag, **{
+                "X-Lobby-Version": str(version),
+            })
+        response.headers["ETag"] = etag
+        response.headers["X-Lobby-Version"] = str(version)
+        return await _get_formatted_games(
+            session,
+            lobby_id,
+            requesting_user.id,
         )
-        games = result.scalars().all()
 
-        user_is_creator = requesting_user.id == games[0].creator_id
-        if not user_is_creator:
-            opponent_nickname = games[0].creator.nickname
-        elif games[0].player:
-            opponent_nickname = games[0].player.nickname
-        else:
-            opponent_nickname = None
+    @staticmethod
+    @router.websocket("/ws")
+    async def websocket(
+        websocket: fastapi.WebSocket,
+        token: str = fastapi.Query(...),
+    ):
+        """Pushes games of user's current lobby as they change.
 
-        formatted_games = []
-        for game in games:
-            formatted_game = {
-                "id": game.id,
-                "lobby_id": game.lobby_id,
-                "game_status_id": game.game_status_id,
-                "creator_id": game.creator_id,
-                "player_id": game.player_id,
-                "creator_card_id": game.creator_card_id,
-                "player_card_id": game.player_card_id,
-                "game_type_id": game.game_type_id,
-                "opponent_nickname": opponent_nickname,
-                "opponent_ready": None,
-                "winner_id": game.winner_id
+        The first message holds all games, the next ones only the games that
+        changed since the previous message. The socket is closed once user
+        leaves the lobby.
+        """
+        policy_violation = fastapi.status.WS_1008_POLICY_VIOLATION
+        async with sessions.get_session_class()() as session:
+            try:
+                user = await access.authenticate(token, session)
+            except fastapi.HTTPException:
+                await websocket.close(code=policy_violation)
+                return
+        if not user.phone.is_confirmed or not user.current_lobby_id:
+            await websocket.close(code=policy_violation)
+            return
+
+        await websocket.accept()
+        async with events.subscribe(
+            events.lobby_channel(user.current_lobby_id),
+        ) as queue:
+            tasks = {
+                asyncio.create_task(_push_games(
+                    websocket,
+                    queue,
+                    user.id,
+                    user.current_lobby_id,
+                )),
+                asyncio.create_task(_receive_until_disconnect(websocket)),
             }
+            done, pending = await asyncio.wait(
+                tasks,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in pending:
+                task.cancel()
+            for task in done:
+                task.result()
 
-            if game.game_status_id != consts.GameStatus.ACTIVE.value:
-                formatted_games.append(formatted_game)
-                continue
-            if user_is_creator:
-                formatted_game["player_card_id"] = None
-                formatted_game["opponent_ready"] = bool(game.player_card_id)
-            else:
-                formatted_game["creator_card_id"] = None
-                formatted_game["opponent_ready"] = bool(game.creator_card_id)
 
+def _format_games(games, user_id: int) -> list[dict]:
+    """Formats lobby games for user, hiding opponent's card in active game.
+    """
+    if not games:
+        return []
+    user_is_creator = user_id == games[0].creator_id
+    if not user_is_creator:
+        opponent_nickname = games[0].creator.nickname
+    elif games[0].player:
+        opponent_nickname = games[0].player.nickname
+    else:
+        opponent_nickname = None
+
+    formatted_games = []
+    for game in games:
+        formatted_game = {
+            "id": game.id,
+            "lobby_id": game.lobby_id,
+            "game_status_id": game.game_status_id,
+            "creator_id": game.creator_id,
+            "player_id": game.player_id,
+            "creator_card_id": game.creator_card_id,
+            "player_card_id": game.player_card_id,
+            "game_type_id": game.game_type_id,
+            "opponent_nickname": opponent_nickname,
+            "opponent_ready": None,
+            "winner_id": game.winner_id
+        }
+
+        if game.game_status_id != consts.GameStatus.ACTIVE.value:
             formatted_games.append(formatted_game)
+            continue
+        if user_is_creator:
+            formatted_game["player_card_id"] = None
+            formatted_game["opponent_ready"] = bool(game.player_card_id)
+        else:
+            formatted_game["creator_card_id"] = None
+            formatted_game["opponent_ready"] = bool(game.creator_card_id)
+
+        formatted_games.append(formatted_game)
+
+    return formatted_games
+
+
+async def _get_formatted_games(
+    session: sa_asyncio.AsyncSession,
+    lobby_id: int,
+    user_id: int,
+) -> list[dict]:
+    result = await session.execute(
+        sa.select(
+            models.Game,
+        ).where(
+            models.Game.lobby_id == lobby_id,
+        ).order_by(
+            models.Game.id,
+        ).options(
+            sa_orm.joinedload(models.Game.creator),
+            sa_orm.joinedload(models.Game.player),
+        )
+    )
+    return _format_games(result.scalars().all(), user_id)
+
+
+async def _get_lobby_version(
+    session: sa_asyncio.AsyncSession,
+    lobby_id: int,
+) -> int:
+    return await session.scalar(
+        sa.select(
+            models.Lobby.version,
+        ).where(
+            models.Lobby.id == lobby_id,
+        )
+    )
+
+
+async def _wait_for_lobby_version(
+    session: sa_asyncio.AsyncSession,
+    lobby_id: int,
+    since_version: int,
+) -> int:
+    """Waits till lobby version differs from since_version or timeout.
+
+    Subscribes before reading the version, so a change committed in between
+    isn't missed.
+    """
+    async with events.subscribe(events.lobby_channel(lobby_id)) as queue:
+        version = await _get_lobby_version(session, lobby_id)
+        if version != since_version:
+            return version
+        # Returns connection to the pool while waiting
+        await session.commit()
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                queue.get(),
+                timeout=settings.GAME_LONG_POLL_TIMEOUT,
+            )
+    return await _get_lobby_version(session, lobby_id)
+
+
+async def _push_games(
+    websocket: fastapi.WebSocket,
+    queue: asyncio.Queue,
+    user_id: int,
+    lobby_id: int,
+):
+    """Sends games that changed since the previous message on every event.
+
+    Closes the socket when user's current lobby is no longer lobby_id, e.g.
+    user left it or it was canceled.
+    """
+    sent_games = {}
+    while True:
+        async with sessions.get_session_class()() as session:
+            current_lobby_id = await session.scalar(
+                sa.select(
+                    models.User.current_lobby_id,
+                ).where(
+                    models.User.id == user_id,
+                )
+            )
+            if current_lobby_id != lobby_id:
+                await websocket.close(
+                    code=fastapi.status.WS_1000_NORMAL_CLOSURE,
+                )
+                return
+            games = await _get_formatted_games(session, lobby_id, user_id)
+        changed_games = [
+            game for game in games
+            if sent_games.get(game["id"]) != game
+        ]
+        if changed_games:
+            await websocket.send_json(changed_games)
+            sent_games.update((game["id"], game) for game in changed_games)
+        await queue.get()
+
 
-        return formatted_games
+async def _receive_until_disconnect(websocket: fastapi.WebSocket):
+    # Client's messages are ignored, they only keep connection alive
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
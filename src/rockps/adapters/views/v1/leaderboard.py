@@ -0,0 +1,43 @@
+import fastapi
+import sqlalchemy as sa
+import sqlalchemy.ext.asyncio as sa_asyncio
+
+from rockps import settings
+from rockps.adapters import models
+from rockps.adapters import sessions
+from rockps.adapters.views import schemes
+from rockps.adapters.views.v1 import access
+
+
+class Leaderboard:
+    router = fastapi.APIRouter()
+
+    @staticmethod
+    @router.get("/", response_model=list[schemes.RatingGet])
+    async def get(
+        size: int = fastapi.Query(settings.LEADERBOARD_SIZE, ge=1, le=100),
+        _: schemes.UserGet = fastapi.Depends(
+            access.get_confirmed_user
+        ),
+        session: sa_asyncio.AsyncSession = fastapi.Depends(
+            sessions.create_session
+        ),
+    ):
+        # Reads the top of user_rating_rating_idx
+        result = await session.execute(
+            sa.select(
+                models.UserRating.user_id,
+                models.User.nickname,
+                models.UserRating.rating,
+                models.UserRating.games,
+            ).join(
+                models.User,
+                models.User.id == models.UserRating.user_id,
+            ).order_by(
+                models.UserRating.rating.desc(),
+                models.UserRating.user_id,
+            ).limit(
+                size,
+            )
+        )
+        return result.mappings().all()
@@ -4,11 +4,14 @@ import sqlalchemy.ext.asyncio as sa_asyncio
 
 from rockps import cases
 from rockps import consts
+from rockps import settings
 from rockps import texts
+from rockps.adapters import events
 from rockps.adapters import models
 from rockps.adapters import sessions
 from rockps.adapters.views import schemes
 from rockps.adapters.views.v1 import access
+from rockps.adapters.views.v1 import etags
 
 
 class Lobby:
@@ -44,6 +47,8 @@ class Lobby:
             model=models.Lobby,
             user_model=models.User,
             game_model=models.Game,
+            ticket_model=models.MatchmakingTicket,
+            event_service=events,
             data={
                 "user_id": requesting_user.id,
                 "user_current_lobby_id": requesting_user.current_lobby_id,
@@ -85,6 +90,7 @@ class Lobby:
             model=models.Lobby,
             game_model=models.Game,
             user_model=models.User,
+            ticket_model=models.MatchmakingTicket,
             data={
                 "creator_id": requesting_user.id,
                 **lobby_data.dict(),
@@ -95,24 +101,77 @@ class Lobby:
         return {"id": lobby.id}
 
     @staticmethod
-    @router.get("/", response_model=list[schemes.LobbyGet])
+    @router.get("/", response_model=schemes.Page[schemes.LobbyGet])
     async def get(
+        request: fastapi.Request,
+        response: fastapi.Response,
+        after_id: int | None = fastapi.Query(None, ge=0),
+        size: int = fastapi.Query(settings.LOBBY_PAGE_SIZE, ge=1, le=100),
+        lobby_type_id: consts.LobbyType | None = None,
+        max_games: int | None = None,
         _: schemes.UserGet = fastapi.Depends(
             access.get_confirmed_user
         ),
         session: sa_asyncio.AsyncSession = fastapi.Depends(
             sessions.create_session
         ),
-
     ):
+        filters = [
+            models.Lobby.lobby_status_id == consts.LobbyStatus.OPENED,
+        ]
+        if lobby_type_id is not None:
+            filters.append(models.Lobby.lobby_type_id == lobby_type_id)
+        if max_games is not None:
+            filters.append(models.Lobby.max_games == max_games)
+
+        result = await session.execute(
+            sa.select(
+                sa.func.count(models.Lobby.id),
+                sa.func.max(models.Lobby.id),
+            ).where(
+                *filters,
+            )
+        )
+        total, max_id = result.one()
+
+        # Lobbies only leave the opened set, and new ones get greater ids, so
+        # any change of the listing changes either count or max id
+        etag = etags.make_etag(
+            total, max_id, after_id, size, lobby_type_id, max_games,
+        )
+        if etags.is_not_modified(request, etag):
+            return etags.not_modified(etag)
+        response.headers["ETag"] = etag
+
+        if after_id is not None:
+            filters.append(models.Lobby.id > after_id)
         result = await session.execute(
             sa.select(
                 models.Lobby, models.User.nickname
+            ).join(
+                models.User,
+                models.User.id == models.Lobby.creator_id,
             ).where(
-                models.Lobby.lobby_status_id == consts.LobbyStatus.OPENED,
+                *filters,
             ).order_by(
                 models.Lobby.id,
+            ).limit(
+                size,
             )
         )
-        lobbies = result.unique().scalars().all()
-        return [schemes.LobbyGet.from_orm(lobby) for lobby in lobbies]
+        items = [
+            schemes.LobbyGet(
+                id=lobby.id,
+                name=lobby.name,
+                max_games=lobby.max_games,
+                lobby_type_id=lobby.lobby_type_id,
+                creator_nickname=nickname,
+            )
+            for lobby, nickname in result.all()
+        ]
+        return {
+            "items": items,
+            "total": total,
+            "size": size,
+            "next_id": items[-1].id if len(items) == size else None,
+        }
@@ -0,0 +1,188 @@
+import asyncio
+import contextlib
+import functools
+
+import fastapi
+import sqlalchemy as sa
+import sqlalchemy.ext.asyncio as sa_asyncio
+
+from rockps import cases
+from rockps import settings
+from rockps import texts
+from rockps.adapters import events
+from rockps.adapters import histograms
+from rockps.adapters import models
+from rockps.adapters import sessions
+from rockps.adapters.views import schemes
+from rockps.adapters.views.v1 import access
+
+WAIT_TIME = histograms.Histogram(settings.MATCHMAKING_WAIT_BUCKETS)
+
+
+class Matchmaking:
+    router = fastapi.APIRouter()
+
+    @staticmethod
+    @router.post("/", response_model=schemes.MatchmakingGet)
+    async def post(
+        matchmaking_data: schemes.MatchmakingPost,
+        requesting_user: models.User = fastapi.Depends(
+            access.get_confirmed_user,
+        ),
+        session: sa_asyncio.AsyncSession = fastapi.Depends(
+            sessions.create_session
+        ),
+    ):
+        """Puts user in queue or pairs them with a waiting opponent.
+
+        lobby_id is None while user waits in queue.
+        """
+        if requesting_user.current_lobby_id:
+            raise fastapi.HTTPException(
+                status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+                detail=[{
+                    "loc": ["body"],
+                    "msg": texts.USER_ALREADY_IN_LOBBY,
+                    "type": "validation_error",
+                }],
+            )
+        if await _get_ticket_id(session, requesting_user.id) is not None:
+            raise fastapi.HTTPException(
+                status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+                detail=[{
+                    "loc": ["body"],
+                    "msg": texts.USER_ALREADY_IN_QUEUE,
+                    "type": "validation_error",
+                }],
+            )
+
+        case = cases.CreateMatchmakingTicket(
+            model=models.MatchmakingTicket,
+            lobby_model=models.Lobby,
+            game_model=models.Game,
+            user_model=models.User,
+            event_service=events,
+            data={
+                "user_id": requesting_user.id,
+                **matchmaking_data.dict(),
+            },
+            session=session,
+        )
+        lobby = await case.execute()
+        if case.opponent_wait_seconds is not None:
+            # Pairing counts only once it is committed
+            sessions.call_after_commit(
+                session,
+                functools.partial(_observe_wait, case.opponent_wait_seconds),
+            )
+        return {"lobby_id": lobby.id if lobby else None}
+
+    @staticmethod
+    @router.get("/", response_model=schemes.MatchmakingGet)
+    async def get(
+        requesting_user: models.User = fastapi.Depends(
+            access.get_confirmed_user,
+        ),
+        session: sa_asyncio.AsyncSession = fastapi.Depends(
+            sessions.create_session
+        ),
+    ):
+        """Waits up to MATCHMAKING_LONG_POLL_TIMEOUT seconds for a pair.
+
+        lobby_id is None if user is still waiting in queue.
+        """
+        if requesting_user.current_lobby_id:
+            return {"lobby_id": requesting_user.current_lobby_id}
+
+        async with events.subscribe(
+            events.user_channel(requesting_user.id),
+        ) as queue:
+            if await _get_ticket_id(session, requesting_user.id) is None:
+                lobby_id = await _get_current_lobby_id(
+                    session,
+                    requesting_user.id,
+                )
+                if lobby_id is None:
+                    raise fastapi.HTTPException(
+                        status_code=fastapi.status.HTTP_404_NOT_FOUND,
+                        detail=[{
+                            "loc": ["body"],
+                            "msg": texts.USER_NOT_IN_QUEUE,
+                            "type": "validation_error",
+                        }],
+                    )
+                return {"lobby_id": lobby_id}
+
+            # Returns connection to the pool while waiting
+            await session.commit()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    queue.get(),
+                    timeout=settings.MATCHMAKING_LONG_POLL_TIMEOUT,
+                )
+        return {
+            "lobby_id": await _get_current_lobby_id(
+                session,
+                requesting_user.id,
+            ),
+        }
+
+    @staticmethod
+    @router.delete("/", response_model=schemes.Identifier)
+    async def delete(
+        requesting_user: models.User = fastapi.Depends(
+            access.get_confirmed_user,
+        ),
+        session: sa_asyncio.AsyncSession = fastapi.Depends(
+            sessions.create_session
+        ),
+    ):
+        ticket_id = await session.scalar(
+            sa.delete(
+                models.MatchmakingTicket,
+            ).where(
+                models.MatchmakingTicket.user_id == requesting_user.id,
+            ).returning(
+                models.MatchmakingTicket.id,
+            )
+        )
+        if ticket_id is None:
+            raise fastapi.HTTPException(
+                status_code=fastapi.status.HTTP_404_NOT_FOUND,
+                detail=[{
+                    "loc": ["body"],
+                    "msg": texts.USER_NOT_IN_QUEUE,
+                    "type": "validation_error",
+                }],
+            )
+        return {"id": ticket_id}
+
+
+async def _get_ticket_id(
+    session: sa_asyncio.AsyncSession,
+    user_id: int,
+) -> int | None:
+    return await session.scalar(
+        sa.select(
+            models.MatchmakingTicket.id,
+        ).where(
+            models.MatchmakingTicket.user_id == user_id,
+        )
+    )
+
+
+async def _get_current_lobby_id(
+    session: sa_asyncio.AsyncSession,
+    user_id: int,
+) -> int | None:
+    return await session.scalar(
+        sa.select(
+            models.User.current_lobby_id,
+        ).where(
+            models.User.id == user_id,
+        )
+    )
+
+
+async def _observe_wait(seconds: float):
+    WAIT_TIME.observe(seconds)
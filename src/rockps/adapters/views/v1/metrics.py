@@ -0,0 +1,31 @@
+import fastapi
+
+from rockps.adapters import engines
+from rockps.adapters import hashers
+from rockps.adapters import janitor
+from rockps.adapters import outbox
+from rockps.adapters import sessions
+from rockps.adapters.services.external import call
+from rockps.adapters.views.v1 import access
+from rockps.adapters.views.v1 import matchmaking
+
+
+class Metrics:
+    # Internals of pools and background tasks aren't for API clients
+    router = fastapi.APIRouter(
+        dependencies=[fastapi.Depends(access.verify_metrics_token)],
+    )
+
+    @staticmethod
+    @router.get("/")
+    async def get():
+        return {
+            "database": engines.Database.stats(),
+            "sessions": sessions.SessionFactory.stats(),
+            "password_hasher": hashers.PasswordHasher.stats(),
+            "token_cache": access.TOKEN_CACHE.stats(),
+            "matchmaking_wait_time": matchmaking.WAIT_TIME.stats(),
+            "call_outbox": outbox.CallOutbox.stats(),
+            "call_service": call.stats(),
+            "janitor": janitor.Janitor.stats(),
+        }
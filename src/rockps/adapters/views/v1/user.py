@@ -1,6 +1,15 @@
+import collections
+import datetime
+
 import fastapi
+import sqlalchemy as sa
+import sqlalchemy.ext.asyncio as sa_asyncio
 
+from rockps import consts
+from rockps import settings
+from rockps import texts
 from rockps.adapters import models
+from rockps.adapters import sessions
 from rockps.adapters.views import schemes
 from rockps.adapters.views.v1 import access
 
@@ -9,10 +18,132 @@ class User:
     router = fastapi.APIRouter()
 
     @staticmethod
-    @router.get("/", response_model=schemes.UserGet)
+    @router.get("/", response_model=schemes.UserProfileGet)
     async def get(
         requesting_user: models.User = fastapi.Depends(
             access.get_confirmed_user
         ),
+        session: sa_asyncio.AsyncSession = fastapi.Depends(
+            sessions.create_session
+        ),
+    ):
+        # Stats are kept up to date by UpdateGame, so it's a primary key
+        # lookup, users without played games have no row yet
+        stats = await session.get(models.UserStats, requesting_user.id)
+        return schemes.UserProfileGet(
+            **schemes.UserGet.from_orm(requesting_user).dict(),
+            stats=(schemes.UserStatsGet.from_orm(stats)
+                   if stats else schemes.UserStatsGet()),
+        )
+
+    @staticmethod
+    @router.get("/history", response_model=schemes.HistoryPage)
+    async def get_history(
+        before_created_dt: datetime.datetime | None = None,
+        before_id: int | None = fastapi.Query(None, ge=0),
+        size: int = fastapi.Query(settings.HISTORY_PAGE_SIZE, ge=1, le=100),
+        requesting_user: models.User = fastapi.Depends(
+            access.get_confirmed_user
+        ),
+        session: sa_asyncio.AsyncSession = fastapi.Depends(
+            sessions.create_session
+        ),
     ):
-        return schemes.UserGet.from_orm(requesting_user)
+        """Returns user's finished and canceled lobbies, latest first."""
+        if (before_created_dt is None) != (before_id is None):
+            raise fastapi.HTTPException(
+                status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+                detail=[{
+                    "loc": ["query"],
+                    "msg": texts.INCOMPLETE_CURSOR,
+                    "type": "validation_error",
+                }],
+            )
+
+        filters = [
+            models.Lobby.lobby_status_id.in_((
+                consts.LobbyStatus.FINISHED,
+                consts.LobbyStatus.CANCELED,
+            )),
+        ]
+        if before_id is not None:
+            filters.append(
+                sa.tuple_(models.Lobby.created_dt, models.Lobby.id) <
+                sa.tuple_(before_created_dt, before_id)
+            )
+        # Each side reads its (creator_id|player_id, created_dt, id) index in
+        # order and stops after size rows, unlike OR, which sorts the whole
+        # history
+        sides = [
+            sa.select(
+                models.Lobby.id,
+            ).where(
+                column == requesting_user.id,
+                *filters,
+            ).order_by(
+                models.Lobby.created_dt.desc(),
+                models.Lobby.id.desc(),
+            ).limit(
+                size,
+            ).subquery()
+            for column in (models.Lobby.creator_id, models.Lobby.player_id)
+        ]
+        lobby_ids = sa.union_all(
+            *(sa.select(side) for side in sides),
+        ).subquery()
+        result = await session.execute(
+            sa.select(
+                models.Lobby,
+            ).join(
+                lobby_ids,
+                lobby_ids.c.id == models.Lobby.id,
+            ).order_by(
+                models.Lobby.created_dt.desc(),
+                models.Lobby.id.desc(),
+            ).limit(
+                size,
+            )
+        )
+        lobbies = result.scalars().all()
+
+        lobby_games = collections.defaultdict(list)
+        if lobbies:
+            result = await session.execute(
+                sa.select(
+                    models.Game,
+                ).where(
+                    models.Game.lobby_id.in_([lobby.id for lobby in lobbies]),
+                ).order_by(
+                    models.Game.lobby_id,
+                    models.Game.id,
+                )
+            )
+            for game in result.scalars():
+                lobby_games[game.lobby_id].append(
+                    schemes.HistoryGameGet.from_orm(game),
+                )
+
+        items = [
+            schemes.HistoryLobbyGet(
+                id=lobby.id,
+                name=lobby.name,
+                created_dt=lobby.created_dt,
+                max_games=lobby.max_games,
+                lobby_type_id=lobby.lobby_type_id,
+                lobby_status_id=lobby.lobby_status_id,
+                creator_id=lobby.creator_id,
+                player_id=lobby.player_id,
+                creator_wins=lobby.creator_wins,
+                player_wins=lobby.player_wins,
+                draws=lobby.draws,
+                games=lobby_games[lobby.id],
+            )
+            for lobby in lobbies
+        ]
+        is_last_page = len(items) < size
+        return {
+            "items": items,
+            "size": size,
+            "next_created_dt": None if is_last_page else items[-1].created_dt,
+            "next_id": None if is_last_page else items[-1].id,
+        }
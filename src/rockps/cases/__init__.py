@@ -2,5 +2,6 @@ from rockps.cases import auth
 from rockps.cases.abstract import CaseDB
 from rockps.cases.create.base import Create
 from rockps.cases.create.lobby import CreateLobby
+from rockps.cases.create.matchmaking import CreateMatchmakingTicket
 from rockps.cases.update.game import UpdateGame
 from rockps.cases.update.lobby import UpdateLobby
@@ -30,7 +30,7 @@ class ResetPasswordNew(
         self.user = certificate.user
 
     async def set_new_password(self):
-        self.user.set_password(self.data["new_password"])
+        await self.user.set_password_async(self.data["new_password"])
         self.session.add(self.user)
         await self.session.flush()
 
@@ -16,6 +16,8 @@ class ResetPasswordRequest(
     mixins.PassConfirmationCode,
 ):
     call_service: object
+    call_outbox_model: entities.IModel
+    code_cooldown: float
     phone_model: entities.IModel
     confirmation_code_model: entities.IModel
 
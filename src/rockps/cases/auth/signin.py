@@ -36,7 +36,9 @@ class SignIn(base.BaseAuth, mixins.ValidatePhone):
         await self.validate_phone_has_user(self.phone, field="username")
 
     async def authenticate(self):
-        if self.phone.user.is_right_password(self.data["password"]):
+        if await self.phone.user.is_right_password_async(
+            self.data["password"],
+        ):
             user = await self.session.get(
                 self.user_model,
                 self.phone.user.id,
@@ -16,6 +16,8 @@ class SignUp(
 ):
     confirmation_code_model: entities.IModel
     call_service: object
+    call_outbox_model: entities.IModel
+    code_cooldown: float
     phone_model: entities.IModel
     user_model: entities.IModel
 
@@ -40,7 +42,7 @@ class SignUp(
         password = self.data.pop("password")
         self.data["phone"] = self.phone_model(number=self.data["phone"])
         user = self.user_model(**self.data)
-        user.set_password(password)
+        await user.set_password_async(password)
         self.data["phone"].user = user
         self.phone = self.data["phone"]
 
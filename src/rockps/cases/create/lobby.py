@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import sqlalchemy as sa
+
 from rockps import consts
 from rockps import entities
 from rockps.cases import mixins
@@ -7,28 +9,48 @@ from rockps.cases.create import base
 
 
 @dataclass
-class CreateLobby(base.Create, mixins.ValidatePhone):
+class CreateLobby(
+    base.Create,
+    mixins.ValidatePhone,
+    mixins.DropMatchmakingTicket,
+):
     game_model: entities.IModel
     user_model: entities.IModel
+    ticket_model: entities.IModel
 
     async def validate(self):
         pass
 
     async def create(self) -> entities.IModel:
-        lobby = await super().create()
-
-        creator = await self.session.get(self.user_model, lobby.creator_id)
-        creator.current_lobby_id = lobby.id
+        # Three round trips whatever max_games is: lobby INSERT ... RETURNING,
+        # multi-row games INSERT and creator UPDATE, which also deletes
+        # creator's matchmaking ticket in a CTE
+        lobby = self.model(**self.data)
+        self.session.add(lobby)
+        await self.session.flush()
 
-        for _ in range(lobby.max_games):
-            game = self.game_model(
-                lobby_id=lobby.id,
-                creator_id=lobby.creator_id,
-                game_status_id=consts.GameStatus.PENDING.value,
-                game_type_id=lobby.lobby_type_id,
+        await self.session.execute(
+            sa.insert(
+                self.game_model,
+            ).values([
+                {
+                    "lobby_id": lobby.id,
+                    "creator_id": lobby.creator_id,
+                    "game_status_id": consts.GameStatus.PENDING.value,
+                    "game_type_id": lobby.lobby_type_id,
+                }
+                for _ in range(lobby.max_games)
+            ])
+        )
+        await self.session.execute(
+            sa.update(
+                self.user_model,
+            ).where(
+                self.user_model.id == lobby.creator_id,
+            ).values(
+                current_lobby_id=lobby.id,
+            ).add_cte(
+                self.delete_matchmaking_ticket(lobby.creator_id).cte(),
             )
-            self.session.add(game)
-
-        self.session.add(creator)
-        await self.session.flush()
+        )
         return lobby
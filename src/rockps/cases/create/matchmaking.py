@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+
+import fastapi
+import sqlalchemy as sa
+
+from rockps import consts
+from rockps import entities
+from rockps import texts
+from rockps.cases.create import base
+from rockps.cases.create import lobby
+from rockps.cases.update import lobby as update_lobby
+
+
+@dataclass
+class CreateMatchmakingTicket(base.Create):
+    lobby_model: entities.IModel
+    game_model: entities.IModel
+    user_model: entities.IModel
+    event_service: object
+
+    def __post_init__(self):
+        # How long the paired opponent waited, None if user is queued
+        self.opponent_wait_seconds = None
+
+    async def lock_queue(self):
+        # Serializes users entering the same queue, so two of them can't both
+        # find it empty and wait for each other forever
+        await self.session.execute(
+            sa.select(
+                sa.func.pg_advisory_xact_lock(
+                    self.data["lobby_type_id"],
+                    self.data["max_games"],
+                ),
+            )
+        )
+
+    async def validate(self):
+        # Checked again under the queue lock, a concurrent request of the
+        # same user may have queued a ticket since the view checked it
+        ticket_id = await self.session.scalar(
+            sa.select(
+                self.model.id,
+            ).where(
+                self.model.user_id == self.data["user_id"],
+            )
+        )
+        if ticket_id is not None:
+            raise _already_in_queue_error()
+
+    async def pop_opponent_ticket(self):
+        ticket_id = sa.select(
+            self.model.id,
+        ).join(
+            self.user_model,
+            self.user_model.id == self.model.user_id,
+        ).where(
+            sa.and_(
+                self.model.lobby_type_id == self.data["lobby_type_id"],
+                self.model.max_games == self.data["max_games"],
+                self.model.user_id != self.data["user_id"],
+                self.user_model.current_lobby_id.is_(None),
+            )
+        ).order_by(
+            self.model.id,
+        ).limit(
+            1,
+        ).scalar_subquery()
+        result = await self.session.execute(
+            sa.delete(
+                self.model,
+            ).where(
+                self.model.id == ticket_id,
+            ).returning(
+                self.model.user_id,
+                sa.extract(
+                    "epoch",
+                    sa.func.now() - self.model.created_dt,
+                ).label("wait_seconds"),
+            )
+        )
+        return result.one_or_none()
+
+    async def create(self) -> entities.IModel | None:
+        """Pairs user with the longest waiting opponent of the same queue.
+
+        Returns lobby created for the pair, or None if there is no opponent
+        yet and user's ticket is left in the queue.
+        """
+        await self.lock_queue()
+        await self.validate()
+        if (opponent_ticket := await self.pop_opponent_ticket()) is None:
+            try:
+                await super().create()
+            except sa.exc.IntegrityError as e:
+                # Concurrent request of the user queued a ticket to another
+                # queue, which is serialized by another lock
+                raise _already_in_queue_error() from e
+            return None
+        self.opponent_wait_seconds = float(opponent_ticket.wait_seconds)
+
+        created_lobby = await lobby.CreateLobby(
+            model=self.lobby_model,
+            game_model=self.game_model,
+            user_model=self.user_model,
+            ticket_model=self.model,
+            data={
+                "name": texts.MATCHMAKING_LOBBY_NAME,
+                "creator_id": opponent_ticket.user_id,
+                "max_games": self.data["max_games"],
+                "lobby_type_id": self.data["lobby_type_id"],
+            },
+            session=self.session,
+        ).execute()
+        await update_lobby.UpdateLobby(
+            model=self.lobby_model,
+            user_model=self.user_model,
+            game_model=self.game_model,
+            ticket_model=self.model,
+            event_service=self.event_service,
+            data={
+                "user_id": self.data["user_id"],
+                "user_current_lobby_id": None,
+                "id": created_lobby.id,
+                "creator_id": opponent_ticket.user_id,
+                "lobby_action_id": consts.LobbyAction.JOIN,
+                "max_games": self.data["max_games"],
+                "lobby_type_id": self.data["lobby_type_id"],
+            },
+            session=self.session,
+        ).execute()
+        self.event_service.publish_after_commit(
+            self.session,
+            self.event_service.user_channel(opponent_ticket.user_id),
+        )
+        return created_lobby
+
+
+def _already_in_queue_error() -> fastapi.HTTPException:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=[{
+            "loc": ["body"],
+            "msg": texts.USER_ALREADY_IN_QUEUE,
+            "type": "validation_error",
+        }],
+    )
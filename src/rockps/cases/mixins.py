@@ -1,3 +1,4 @@
+import datetime
 import functools
 import random
 import string
@@ -138,18 +139,78 @@ class ValidateCertificate(ValidateObject):
 
 
 class PassConfirmationCode:
+    """Passes a confirmation code to the phone by call.
+
+    Repeated requests for the same number and code type within code_cooldown
+    seconds reuse the code already passed instead of making another call,
+    unless the call of that code has failed.
+    """
     session: AsyncSession
     confirmation_code_model: entities.IModel
+    phone_model: entities.IModel
+    call_outbox_model: entities.IModel
     call_service: object
+    code_cooldown: float
+
+    async def lock_phone_number(self, phone):
+        # Serializes requests for the number, so concurrent ones can't both
+        # miss the recent code and make two calls
+        await self.session.execute(
+            sa.select(
+                sa.func.pg_advisory_xact_lock(
+                    sa.func.hashtext(f"confirmation_code:{phone.number}"),
+                ),
+            )
+        )
+
+    async def get_recent_code(self, phone, code_type):
+        code_model = self.confirmation_code_model
+        # Call is made (call_id is set) or still queued, a code whose call
+        # was dropped after all attempts never reached the user
+        is_call_alive = sa.or_(
+            code_model.call_id.is_not(None),
+            sa.exists().where(
+                self.call_outbox_model.confirmation_code_id == code_model.id,
+            ),
+        )
+        result = await self.session.execute(
+            sa.select(
+                self.confirmation_code_model,
+            ).join(
+                self.phone_model,
+            ).where(
+                self.phone_model.number == phone.number,
+                self.confirmation_code_model.type_id == code_type,
+                self.confirmation_code_model.created_dt > (
+                    sa.func.now() - datetime.timedelta(
+                        seconds=self.code_cooldown,
+                    )
+                ),
+                is_call_alive,
+            ).order_by(
+                self.confirmation_code_model.id.desc(),
+            ).limit(1)
+        )
+        return result.scalars().first()
 
     async def pass_confirmation_code(self, phone, code_type):
+        await self.lock_phone_number(phone)
+        code = await self.get_recent_code(phone, code_type)
+        if code is not None:
+            # Sign-up makes a new phone on every attempt, so the code moves to
+            # the latest one, which is confirmed with it
+            code.phone = phone
+            await self.session.flush()
+            return
+
         code = self.confirmation_code_model(
             value=''.join(random.choice(string.digits) for _ in range(4)),
             phone=phone,
             type_id=code_type,
         )
-        code.call_id = await self.call_service.call(phone.number, code.value)
         self.session.add(code)
+        # The call is made in background after commit, it sets code's call_id
+        self.call_service.enqueue_call(self.session, code)
         await self.session.flush()
 
 
@@ -183,3 +244,31 @@ class ValidateConfirmationCode(ValidateObject):
 
         self.phone = self.code.phone
         await self.validate_object_exists(self.code.value == self.data["code"])
+
+
+class DropMatchmakingTicket:
+    session: AsyncSession
+    ticket_model: entities.IModel
+
+    def delete_matchmaking_ticket(self, user_id: int) -> sa.Delete:
+        # Ticket left in queue would pair user once they leave the lobby
+        return sa.delete(
+            self.ticket_model,
+        ).where(
+            self.ticket_model.user_id == user_id,
+        )
+
+    async def drop_matchmaking_ticket(self, user_id: int):
+        await self.session.execute(self.delete_matchmaking_ticket(user_id))
+
+
+class PublishLobbyEvents:
+    session: AsyncSession
+    event_service: object
+
+    def publish_lobby_changed(self, lobby_id: int):
+        """Notifies lobby subscribers once the transaction is committed."""
+        self.event_service.publish_after_commit(
+            self.session,
+            self.event_service.lobby_channel(lobby_id),
+        )
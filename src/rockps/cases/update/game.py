@@ -1,18 +1,44 @@
 from dataclasses import dataclass
 
 import fastapi
-import loguru
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as sa_pgsql
 
 from rockps import consts
+from rockps import entities
 from rockps import texts
+from rockps.cases import mixins
 from rockps.cases.update import base
 
 
 @dataclass
-class UpdateGame(base.Update):
+class UpdateGame(base.Update, mixins.PublishLobbyEvents):
+    lobby_model: entities.IModel
+    rating_model: entities.IModel
+    stats_model: entities.IModel
+    event_service: object
+
     async def validate(self):
         await super().validate()
+        # Game row stays locked till the end of transaction, so concurrent
+        # moves see each other's card and only one of them finishes the game
+        self.obj = await self.session.get(
+            self.model,
+            self.data["id"],
+            with_for_update=True,
+            populate_existing=True,
+        )
+        self.data["creator_card_id"] = self.obj.creator_card_id
+        self.data["player_card_id"] = self.obj.player_card_id
+        if self.obj.game_status_id != consts.GameStatus.ACTIVE:
+            raise fastapi.HTTPException(
+                status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+                detail=[{
+                    "loc": ["body"],
+                    "msg": texts.GAME_NOT_ACTIVE,
+                    "type": "validation_error",
+                }],
+            )
         if (self.data["user_id"] == self.data["creator_id"] and
                 self.data["creator_card_id"] or self.data["player_card_id"] and
                 self.data["user_id"] == self.data["player_id"]):
@@ -24,8 +50,8 @@ class UpdateGame(base.Update):
                     "type": "validation_error",
                 }],
             )
-        if (self.data["game_type_id"] == consts.GameType.STANDARD and
-                self.data["user_card_id"] > consts.Card.SCISSORS):
+        rules = entities.rules.GAME_RULES[self.data["game_type_id"]]
+        if not rules.is_valid(self.data["user_card_id"]):
             raise fastapi.HTTPException(
                 status_code=fastapi.status.HTTP_400_BAD_REQUEST,
                 detail=[{
@@ -41,27 +67,17 @@ class UpdateGame(base.Update):
         creator_id: int,
         player_card_id: int,
         player_id: int,
+        game_type_id: int = consts.GameType.STANDARD,
     ) -> int | None:
-        loguru.logger.info("Calculating")
-        if player_card_id == creator_card_id:
-            return None
-        # pylint: disable=line-too-long,too-many-boolean-expressions
-        if (player_card_id == consts.Card.ROCK and creator_card_id == consts.Card.SCISSORS) or \
-                (player_card_id == consts.Card.SCISSORS and creator_card_id == consts.Card.PAPER) or \
-                (player_card_id == consts.Card.PAPER and creator_card_id == consts.Card.ROCK) or \
-                (player_card_id == consts.Card.ROCK and creator_card_id == consts.Card.LIZARD) or \
-                (player_card_id == consts.Card.LIZARD and creator_card_id == consts.Card.SPOCK) or \
-                (player_card_id == consts.Card.SPOCK and creator_card_id == consts.Card.SCISSORS) or \
-                (player_card_id == consts.Card.SCISSORS and creator_card_id == consts.Card.LIZARD) or \
-                (player_card_id == consts.Card.LIZARD and creator_card_id == consts.Card.PAPER) or \
-                (player_card_id == consts.Card.PAPER and creator_card_id == consts.Card.SPOCK) or \
-                (player_card_id == consts.Card.SPOCK and creator_card_id == consts.Card.ROCK):
-            return player_id
-        return creator_id
+        rules = entities.rules.GAME_RULES[game_type_id]
+        return {
+            entities.rules.FIRST_WINS: creator_id,
+            entities.rules.SECOND_WINS: player_id,
+            entities.rules.DRAW: None,
+        }[rules.compare(creator_card_id, player_card_id)]
 
     async def update(self):
         user_id = self.data.pop("user_id")
-        self.obj = await self.session.get(self.model, self.data["id"])
         if user_id == self.data["creator_id"]:
             self.data["creator_card_id"] = self.data.pop("user_card_id")
         if user_id == self.data["player_id"]:
@@ -69,56 +85,192 @@ class UpdateGame(base.Update):
 
         if self.data["creator_card_id"] and self.data["player_card_id"]:
             self.data["game_status_id"] = consts.GameStatus.FINISHED.value
-
-            score = {
-                None: 0,  # Draw
-                self.data["creator_id"]: 0,
-                self.data["player_id"]: 0,
-            }
             self.data["winner_id"] = await self.calculate_game_result(
                 creator_card_id=self.data["creator_card_id"],
                 creator_id=self.data["creator_id"],
                 player_card_id=self.data["player_card_id"],
                 player_id=self.data["player_id"],
+                game_type_id=self.data["game_type_id"],
+            )
+            await self.update_user_stats()
+            await self.update_lobby_score()
+        else:
+            await self.bump_lobby_version()
+        await super().update()
+        self.publish_lobby_changed(self.data["lobby_id"])
+
+    async def update_user_stats(self):
+        """Counts finished game in both players' stats with one upsert."""
+        stats_model = self.stats_model
+        winner_id = self.data["winner_id"]
+        rows = []
+        for user_id, card_id in sorted((
+            (self.data["creator_id"], self.data["creator_card_id"]),
+            (self.data["player_id"], self.data["player_card_id"]),
+        )):
+            rows.append({
+                "user_id": user_id,
+                "games": 1,
+                "wins": int(winner_id == user_id),
+                "losses": int(winner_id not in (None, user_id)),
+                "draws": int(winner_id is None),
+                **{
+                    f"{card.name.lower()}_played": int(card == card_id)
+                    for card in consts.Card
+                },
+            })
+        insert = sa_pgsql.insert(stats_model).values(rows)
+        await self.session.execute(
+            insert.on_conflict_do_update(
+                index_elements=[stats_model.user_id],
+                set_={
+                    column: getattr(stats_model, column) +
+                        getattr(insert.excluded, column)
+                    for column in rows[0]
+                    if column != "user_id"
+                },
+            )
+        )
+
+    async def update_lobby_score(self):
+        """Counts finished game in lobby's running score.
+
+        Activates the next pending game or finishes the lobby when someone
+        has won the majority of games or there are no games left.
+        """
+        lobby_model = self.lobby_model
+        winner_id = self.data["winner_id"]
+        result = await self.session.execute(
+            sa.update(
+                lobby_model,
+            ).where(
+                lobby_model.id == self.data["lobby_id"],
+            ).values(
+                creator_wins=lobby_model.creator_wins +
+                    int(winner_id == self.data["creator_id"]),
+                player_wins=lobby_model.player_wins +
+                    int(winner_id == self.data["player_id"]),
+                draws=lobby_model.draws + int(winner_id is None),
+                current_game_index=lobby_model.current_game_index + 1,
+                version=lobby_model.version + 1,
+            ).returning(
+                lobby_model.creator_wins,
+                lobby_model.player_wins,
+                lobby_model.current_game_index,
+                lobby_model.max_games,
+            )
+        )
+        score = result.one()
+
+        if (max(score.creator_wins, score.player_wins) > score.max_games / 2 or
+                score.current_game_index >= score.max_games or
+                not await self.activate_next_game()):
+            await self.finish_lobby()
+            await self.update_ratings(score.creator_wins, score.player_wins)
+
+    async def bump_lobby_version(self):
+        await self.session.execute(
+            sa.update(
+                self.lobby_model,
+            ).where(
+                self.lobby_model.id == self.data["lobby_id"],
+            ).values(
+                version=self.lobby_model.version + 1,
+            )
+        )
+
+    async def activate_next_game(self) -> bool:
+        next_game_id = sa.select(
+            sa.func.min(self.model.id),
+        ).where(
+            sa.and_(
+                self.model.lobby_id == self.data["lobby_id"],
+                self.model.id != self.data["id"],
+                self.model.game_status_id == consts.GameStatus.PENDING,
+            )
+        ).scalar_subquery()
+        result = await self.session.execute(
+            sa.update(
+                self.model,
+            ).where(
+                self.model.id == next_game_id,
+            ).values(
+                game_status_id=consts.GameStatus.ACTIVE.value,
+            ).execution_options(
+                synchronize_session=False,
             )
-            loguru.logger.info(self.data["winner_id"])
-            score[self.data["winner_id"]] += 1
+        )
+        return bool(result.rowcount)
 
-            result = await self.session.execute(
-                sa.select(
-                    self.model,
-                ).where(
+    async def update_ratings(self, creator_wins: int, player_wins: int):
+        """Moves rating points between lobby's players by lobby result."""
+        creator_id = self.data["creator_id"]
+        player_id = self.data["player_id"]
+        rating_model = self.rating_model
+        # Upsert locks both rows, sorted ids keep the lock order the same for
+        # concurrent transactions
+        insert = sa_pgsql.insert(
+            rating_model,
+        ).values([
+            {"user_id": user_id}
+            for user_id in sorted((creator_id, player_id))
+        ])
+        result = await self.session.execute(
+            insert.on_conflict_do_update(
+                index_elements=[rating_model.user_id],
+                set_={"games": rating_model.games},
+            ).returning(
+                rating_model.user_id,
+                rating_model.rating,
+            )
+        )
+        ratings = dict(result.all())
+
+        creator_rating, player_rating = entities.ratings.rate(
+            ratings[creator_id],
+            ratings[player_id],
+            entities.ratings.lobby_score(creator_wins, player_wins),
+        )
+        await self.session.execute(
+            sa.update(
+                rating_model,
+            ).where(
+                rating_model.user_id.in_((creator_id, player_id)),
+            ).values(
+                rating=sa.case(
+                    (rating_model.user_id == creator_id, creator_rating),
+                    else_=player_rating,
+                ),
+                games=rating_model.games + 1,
+            ).execution_options(
+                synchronize_session=False,
+            )
+        )
+
+    async def finish_lobby(self):
+        await self.session.execute(
+            sa.update(
+                self.lobby_model,
+            ).where(
+                self.lobby_model.id == self.data["lobby_id"],
+            ).values(
+                lobby_status_id=consts.LobbyStatus.FINISHED.value,
+                # Time of the statement, not of the transaction start
+                finished_dt=sa.func.clock_timestamp(),
+            )
+        )
+        await self.session.execute(
+            sa.update(
+                self.model,
+            ).where(
+                sa.and_(
                     self.model.lobby_id == self.data["lobby_id"],
-                ).order_by(
-                    self.model.id,
+                    self.model.id != self.data["id"],
+                    self.model.game_status_id == consts.GameStatus.PENDING,
                 )
+            ).values(
+                game_status_id=consts.GameStatus.FINISHED.value,
+            ).execution_options(
+                synchronize_session=False,
             )
-            games = result.scalars().all()
-
-            next_game_id = -1
-            for i, game in enumerate(games):
-                if next_game_id >= i:
-                    score[None] = 0
-                    if max(score.values()) > len(games) / 2:
-                        game.game_status_id = consts.GameStatus.FINISHED.value
-                        self.session.add(game)
-                    else:
-                        loguru.logger.info("Make next game active")
-                        game.game_status_id = consts.GameStatus.ACTIVE.value
-                        self.session.add(game)
-                        next_game_id = 0
-                        break
-
-                if game.id != self.data["id"]:
-                    score[game.winner_id] += 1
-                else:
-                    next_game_id = i + 1
-
-            if max(score.values()) > len(games) / 2 or next_game_id != 0:
-                lobby = await self.session.get(
-                    self.model,
-                    self.data["lobby_id"],
-                )
-                lobby.lobby_status_id = consts.LobbyStatus.FINISHED.value
-                self.session.add(lobby)
-        await super().update()
+        )
@@ -6,17 +6,33 @@ import sqlalchemy as sa
 from rockps import consts
 from rockps import entities
 from rockps import texts
+from rockps.cases import mixins
 from rockps.cases.update import base
 
 
 @dataclass
-class UpdateLobby(base.Update):
+class UpdateLobby(
+    base.Update,
+    mixins.PublishLobbyEvents,
+    mixins.DropMatchmakingTicket,
+):
     user_model: entities.IModel
     game_model: entities.IModel
+    ticket_model: entities.IModel
+    event_service: object
 
     async def validate(self):
         await super().validate()
-        self.obj = await self.session.get(self.model, self.data.pop("id"))
+        # Lobby row stays locked till the end of transaction, so two players
+        # can't join the same opened lobby concurrently
+        self.obj = await self.session.get(
+            self.model,
+            self.data.pop("id"),
+            with_for_update=True,
+            populate_existing=True,
+        )
+        self.data["lobby_status_id"] = self.obj.lobby_status_id
+        self.data["player_id"] = self.obj.player_id
         user_current_lobby_id = self.data.pop("user_current_lobby_id", None)
         detail = [{
             "loc": ["body"],
@@ -38,57 +54,80 @@ class UpdateLobby(base.Update):
                 detail=detail,
             )
 
-    async def update(self):
-        user_id = self.data.pop("user_id")
-        lobby_action_id = self.data.pop("lobby_action_id")
-        user = await self.session.get(self.user_model, user_id)
-
-        if (lobby_action_id == consts.LobbyAction.LEAVE and
-                self.data["lobby_status_id"] in
-                (consts.LobbyStatus.OPENED, consts.LobbyStatus.ACTIVE)):
-            self.data["lobby_status_id"] = consts.LobbyStatus.CANCELED.value
+    async def set_user_lobby(self, user_id: int, lobby_id: int | None):
+        await self.session.execute(
+            sa.update(
+                self.user_model,
+            ).where(
+                self.user_model.id == user_id,
+            ).values(
+                current_lobby_id=lobby_id,
+            )
+        )
 
-            user.current_lobby_id = None
-            self.session.add(user)
+    async def start_games(self, player_id: int):
+        first_game_id = sa.select(
+            sa.func.min(self.game_model.id),
+        ).where(
+            self.game_model.lobby_id == self.obj.id,
+        ).scalar_subquery()
+        await self.session.execute(
+            sa.update(
+                self.game_model,
+            ).where(
+                self.game_model.lobby_id == self.obj.id,
+            ).values(
+                player_id=player_id,
+                game_status_id=sa.case(
+                    (
+                        self.game_model.id == first_game_id,
+                        consts.GameStatus.ACTIVE.value,
+                    ),
+                    else_=consts.GameStatus.PENDING.value,
+                ),
+            ).execution_options(
+                synchronize_session=False,
+            )
+        )
 
-            result = await self.session.execute(
-                sa.select(
-                    self.game_model,
-                ).where(
+    async def cancel_games(self):
+        await self.session.execute(
+            sa.update(
+                self.game_model,
+            ).where(
+                sa.and_(
                     self.game_model.lobby_id == self.obj.id,
+                    self.game_model.game_status_id.in_((
+                        consts.GameStatus.ACTIVE,
+                        consts.GameStatus.PENDING,
+                    )),
                 )
+            ).values(
+                game_status_id=consts.GameStatus.CANCELED.value,
+            ).execution_options(
+                synchronize_session=False,
             )
-            games = result.scalars().all()
-            for game in games:
-                if (game.game_status_id in
-                        (consts.GameStatus.ACTIVE, consts.GameStatus.PENDING)):
-                    game.game_status_id = consts.GameStatus.CANCELED.value
-                    self.session.add(game)
+        )
 
-        elif lobby_action_id == consts.LobbyAction.LEAVE:
-            user.current_lobby_id = None
-            self.session.add(user)
+    async def update(self):
+        user_id = self.data.pop("user_id")
+        lobby_action_id = self.data.pop("lobby_action_id")
+
+        if lobby_action_id == consts.LobbyAction.LEAVE:
+            if self.data["lobby_status_id"] in (
+                    consts.LobbyStatus.OPENED, consts.LobbyStatus.ACTIVE):
+                self.data["lobby_status_id"] = \
+                    consts.LobbyStatus.CANCELED.value
+                await self.cancel_games()
+            await self.set_user_lobby(user_id, None)
 
         elif lobby_action_id == consts.LobbyAction.JOIN:
-            user.current_lobby_id = self.obj.id
             self.data["player_id"] = user_id
             self.data["lobby_status_id"] = consts.LobbyStatus.ACTIVE.value
-            self.session.add(user)
-
-            result = await self.session.execute(
-                sa.select(
-                    self.game_model,
-                ).where(
-                    self.game_model.lobby_id == self.obj.id,
-                )
-            )
-            games = result.scalars().all()
-
-            games[0].player_id = user_id
-            games[0].game_status_id = consts.GameStatus.ACTIVE.value
-            for game in games[1:]:
-                game.player_id = user_id
-                game.game_status_id = consts.GameStatus.PENDING.value
-                self.session.add(game)
+            await self.set_user_lobby(user_id, self.obj.id)
+            await self.drop_matchmaking_ticket(user_id)
+            await self.start_games(user_id)
 
+        self.data["version"] = self.obj.version + 1
         await super().update()
+        self.publish_lobby_changed(self.obj.id)
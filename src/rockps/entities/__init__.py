@@ -1 +1,3 @@
 from rockps.entities.imodel import IModel
+from rockps.entities import ratings
+from rockps.entities import rules
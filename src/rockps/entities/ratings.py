@@ -0,0 +1,35 @@
+"""Elo ratings of lobby results."""
+INITIAL_RATING = 1000.0
+K_FACTOR = 32.0
+
+WIN = 1.0
+DRAW = 0.5
+LOSS = 0.0
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def lobby_score(creator_wins: int, player_wins: int) -> float:
+    """Returns creator's score in lobby, player's one is 1 - score."""
+    if creator_wins > player_wins:
+        return WIN
+    if creator_wins < player_wins:
+        return LOSS
+    return DRAW
+
+
+def rate(
+    first_rating: float,
+    second_rating: float,
+    first_score: float,
+    k_factor: float = K_FACTOR,
+) -> tuple[float, float]:
+    """Returns new ratings of two opponents after a match.
+
+    Points are moved from one opponent to another, so the sum of ratings
+    stays the same.
+    """
+    delta = k_factor * (first_score - expected_score(first_rating, second_rating))
+    return first_rating + delta, second_rating - delta
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from rockps import consts
+
+DRAW = 0
+FIRST_WINS = 1
+SECOND_WINS = -1
+
+
+@dataclass(frozen=True)
+class Rules:
+    """Precomputed beats-matrix of one game variant.
+
+    The matrix is flattened and indexed by card ids, so resolving a game is
+    a single tuple lookup whatever the number of cards in the variant.
+    """
+    cards: frozenset[int]
+    size: int
+    matrix: tuple[int, ...]
+
+    @classmethod
+    def from_beats(cls, beats: Iterable[tuple[int, int]]) -> Rules:
+        """Builds rules from (winner card, loser card) pairs."""
+        beats = list(beats)
+        cards = frozenset(card for pair in beats for card in pair)
+        size = max(cards) + 1
+        matrix = [DRAW] * size * size
+        for winner, loser in beats:
+            matrix[winner * size + loser] = FIRST_WINS
+            matrix[loser * size + winner] = SECOND_WINS
+        return cls(cards=cards, size=size, matrix=tuple(matrix))
+
+    @classmethod
+    def cyclic(cls, cards: Sequence[int]) -> Rules:
+        """Builds balanced rules for an odd number of cards.
+
+        Every card beats the (n - 1) / 2 cards following it in the cyclic
+        order, which covers RPS, RPSLS and their 7-, 9-, 15-card extensions.
+        """
+        count = len(cards)
+        if count % 2 == 0:
+            raise ValueError("Balanced rules need an odd number of cards")
+        return cls.from_beats(
+            (card, cards[(i + offset) % count])
+            for i, card in enumerate(cards)
+            for offset in range(1, count // 2 + 1)
+        )
+
+    def is_valid(self, card: int) -> bool:
+        return card in self.cards
+
+    def compare(self, first_card: int, second_card: int) -> int:
+        """Returns FIRST_WINS, SECOND_WINS or DRAW."""
+        return self.matrix[first_card * self.size + second_card]
+
+    def compare_many(
+        self,
+        first_cards: Iterable[int],
+        second_cards: Iterable[int],
+    ) -> list[int]:
+        """Resolves many games at once, e.g. for replays and analytics."""
+        matrix, size = self.matrix, self.size
+        return [
+            matrix[first * size + second]
+            for first, second in zip(first_cards, second_cards)
+        ]
+
+
+GAME_RULES: dict[int, Rules] = {
+    consts.GameType.STANDARD: Rules.cyclic((
+        consts.Card.ROCK,
+        consts.Card.SCISSORS,
+        consts.Card.PAPER,
+    )),
+    consts.GameType.EXTENDED: Rules.cyclic((
+        consts.Card.ROCK,
+        consts.Card.SCISSORS,
+        consts.Card.LIZARD,
+        consts.Card.PAPER,
+        consts.Card.SPOCK,
+    )),
+}
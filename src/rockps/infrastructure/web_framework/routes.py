@@ -17,7 +17,10 @@ async def init(app: fastapi.FastAPI):
 
         {"router": views.v1.lobby.Lobby().router, "prefix": "/api/v1/lobby"},
         {"router": views.v1.game.Game().router, "prefix": "/api/v1/game"},
+        {"router": views.v1.matchmaking.Matchmaking().router, "prefix": "/api/v1/matchmaking"},
+        {"router": views.v1.leaderboard.Leaderboard().router, "prefix": "/api/v1/leaderboard"},
         {"router": views.v1.user.User().router, "prefix": "/api/v1/user"},
+        {"router": views.v1.metrics.Metrics().router, "prefix": "/api/v1/metrics"},
     ]
 
     for router_config in _ROUTER_CONFIGS:
@@ -0,0 +1,103 @@
+"""Reports queries that can't be served without sequential scans.
+
+Records every statement executed while the test suite runs, then EXPLAINs
+each of them with sequential scans disabled. A Seq Scan left in such plan
+means no index fits the query.
+
+Usage: python -m rockps.jobs.index_advisor [pytest args]
+"""
+import asyncio
+import json
+import sys
+
+import asyncpg
+import pytest
+import sqlalchemy as sa
+
+from rockps import settings
+
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+class QueryRecorder:
+    """Collects distinct statements executed by any SQLAlchemy engine."""
+
+    def __init__(self) -> None:
+        self.queries: dict[str, tuple] = {}
+
+    def __call__(
+        self,
+        conn,
+        cursor,
+        statement,
+        parameters,
+        context,
+        executemany,
+    ):  # pylint: disable=too-many-arguments, unused-argument
+        if (not executemany and
+                statement.lstrip().upper().startswith(_EXPLAINABLE)):
+            self.queries.setdefault(statement, tuple(parameters or ()))
+
+    def start(self):
+        sa.event.listen(sa.engine.Engine, "before_cursor_execute", self)
+
+    def stop(self):
+        sa.event.remove(sa.engine.Engine, "before_cursor_execute", self)
+
+
+def find_seq_scans(plan: dict) -> list[str]:
+    """Returns relations scanned sequentially by plan node and its children.
+    """
+    relations = []
+    if plan["Node Type"] == "Seq Scan":
+        relations.append(plan["Relation Name"])
+    for child in plan.get("Plans", ()):
+        relations.extend(find_seq_scans(child))
+    return relations
+
+
+async def explain(queries: dict[str, tuple]) -> dict[str, list[str]]:
+    """Returns statements whose plans have sequential scans.
+
+    Statements that can't be explained are reported with the error instead.
+    """
+    report = {}
+    connection = await asyncpg.connect(settings.DATABASE_SYNC_URL)
+    try:
+        await connection.execute("SET enable_seqscan = off")
+        for statement, parameters in queries.items():
+            try:
+                result = await connection.fetchval(
+                    f"EXPLAIN (FORMAT JSON) {statement}",
+                    *parameters,
+                )
+            except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                report[statement] = [f"not explained: {e}"]
+                continue
+            if relations := find_seq_scans(json.loads(result)[0]["Plan"]):
+                report[statement] = relations
+    finally:
+        await connection.close()
+    return report
+
+
+def main(args: list[str]) -> int:
+    recorder = QueryRecorder()
+    recorder.start()
+    try:
+        exit_code = pytest.main(args)
+    finally:
+        recorder.stop()
+
+    report = asyncio.run(explain(recorder.queries))
+    print(
+        f"\n{len(report)} of {len(recorder.queries)} queries "
+        "have sequential scans"
+    )
+    for statement, relations in report.items():
+        print(f"\n{', '.join(relations)}:\n{statement}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
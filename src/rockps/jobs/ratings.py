@@ -0,0 +1,134 @@
+"""Recomputes user ratings from the whole history of finished lobbies.
+
+Usage: python -m rockps.jobs.ratings [--chunk-size N]
+"""
+import argparse
+import asyncio
+import collections
+
+import loguru
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps import consts
+from rockps import entities
+from rockps.adapters import engines
+from rockps.adapters import models
+from rockps.adapters import sessions
+
+
+class _Ratings:
+
+    def __init__(self) -> None:
+        self.ratings = collections.defaultdict(
+            lambda: entities.ratings.INITIAL_RATING,
+        )
+        self.games = collections.Counter()
+
+    def rate(
+        self,
+        creator_id: int,
+        player_id: int,
+        creator_wins: int,
+        player_wins: int,
+    ):
+        self.ratings[creator_id], self.ratings[player_id] = \
+            entities.ratings.rate(
+                self.ratings[creator_id],
+                self.ratings[player_id],
+                entities.ratings.lobby_score(creator_wins, player_wins),
+            )
+        self.games[creator_id] += 1
+        self.games[player_id] += 1
+
+    def rows(self) -> list[dict]:
+        return [
+            {"user_id": user_id, "rating": rating, "games": self.games[user_id]}
+            for user_id, rating in self.ratings.items()
+        ]
+
+
+async def recompute(session: AsyncSession, chunk_size: int) -> int:
+    """Replaces user_rating with ratings replayed from played games.
+
+    Games are streamed with a server-side cursor chunk by chunk, so memory
+    holds only one chunk and a rating per user. Returns number of rated
+    lobbies.
+    """
+    # Incremental updates of finishing lobbies wait for the job instead of
+    # being overwritten by it
+    await session.execute(sa.text("LOCK TABLE user_rating IN EXCLUSIVE MODE"))
+
+    result = await session.stream(
+        sa.select(
+            models.Game.lobby_id,
+            models.Lobby.creator_id,
+            models.Lobby.player_id,
+            models.Game.winner_id,
+        ).join(
+            models.Lobby,
+            models.Lobby.id == models.Game.lobby_id,
+        ).where(
+            sa.and_(
+                models.Lobby.lobby_status_id == consts.LobbyStatus.FINISHED,
+                models.Game.game_status_id == consts.GameStatus.FINISHED,
+                models.Game.creator_card_id.is_not(None),
+                models.Game.player_card_id.is_not(None),
+            )
+        ).order_by(
+            # Same order as incremental updates, as Elo depends on it.
+            # Lobbies finished before finished_dt was added go first
+            models.Lobby.finished_dt.asc().nulls_first(),
+            models.Game.lobby_id,
+            models.Game.id,
+        ).execution_options(
+            yield_per=chunk_size,
+        )
+    )
+
+    # Rows of a lobby are adjacent, so a lobby is rated once its rows are over
+    ratings = _Ratings()
+    lobbies = 0
+    lobby_id = creator_id = player_id = None
+    creator_wins = player_wins = 0
+    async for rows in result.partitions():
+        for row in rows:
+            if row.lobby_id != lobby_id:
+                if lobby_id is not None:
+                    ratings.rate(creator_id, player_id, creator_wins, player_wins)
+                    lobbies += 1
+                lobby_id, creator_id, player_id = \
+                    row.lobby_id, row.creator_id, row.player_id
+                creator_wins = player_wins = 0
+            creator_wins += row.winner_id == creator_id
+            player_wins += row.winner_id == player_id
+    if lobby_id is not None:
+        ratings.rate(creator_id, player_id, creator_wins, player_wins)
+        lobbies += 1
+
+    await session.execute(sa.delete(models.UserRating))
+    rows = ratings.rows()
+    for start in range(0, len(rows), chunk_size):
+        await session.execute(
+            sa.insert(models.UserRating),
+            rows[start:start + chunk_size],
+        )
+    return lobbies
+
+
+async def main(chunk_size: int):
+    engines.Database.init()
+    sessions.SessionFactory.init()
+    try:
+        async with sessions.get_session_class()() as session:
+            lobbies = await recompute(session, chunk_size)
+            await session.commit()
+        loguru.logger.info("Ratings are recomputed from {} lobbies", lobbies)
+    finally:
+        await engines.Database.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args().chunk_size))
@@ -9,6 +9,14 @@ SECRET_KEY = env.str("SECRET_KEY")
 # Authorization
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 3
 JWT_ALGORITHM = "HS256"
+TOKEN_CACHE_SIZE = env.int("TOKEN_CACHE_SIZE", 10000)
+# Bearer token of /api/v1/metrics, the endpoint is hidden while it's unset
+METRICS_TOKEN = env.str("METRICS_TOKEN", None)
+
+# Password hashing
+PASSWORD_HASHER_EXECUTOR = env.str("PASSWORD_HASHER_EXECUTOR", "thread")  # thread or process
+PASSWORD_HASHER_WORKERS = env.int("PASSWORD_HASHER_WORKERS", 2)
+PASSWORD_HASHER_MAX_CONCURRENCY = env.int("PASSWORD_HASHER_MAX_CONCURRENCY", 4)
 
 # Database
 POSTGRES_USER = env.str("POSTGRES_USER")
@@ -18,13 +26,77 @@ POSTGRES_PORT = env.str("POSTGRES_PORT")
 POSTGRES_HOST = env.str("POSTGRES_HOST")
 DATABASE_ASYNC_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"  # pylint: disable=line-too-long
 DATABASE_SYNC_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"  # pylint: disable=line-too-long
+DATABASE_POOL_CLASS = env.str("DATABASE_POOL_CLASS", "queue")  # queue or null
+DATABASE_POOL_SIZE = env.int("DATABASE_POOL_SIZE", 5)
+DATABASE_MAX_OVERFLOW = env.int("DATABASE_MAX_OVERFLOW", 10)
+DATABASE_POOL_TIMEOUT = env.float("DATABASE_POOL_TIMEOUT", 30)
+DATABASE_POOL_RECYCLE = env.int("DATABASE_POOL_RECYCLE", -1)
+DATABASE_POOL_PRE_PING = env.bool("DATABASE_POOL_PRE_PING", False)
+# Set to 0 behind pgbouncer in transaction mode
+DATABASE_STATEMENT_CACHE_SIZE = env.int("DATABASE_STATEMENT_CACHE_SIZE", 100)
+
+# Events
+# postgres delivers events to every worker, memory only within one process
+EVENT_BUS_BACKEND = env.str("EVENT_BUS_BACKEND", "postgres")
+# Seconds between attempts to restore lost LISTEN connection, doubles up to max
+EVENT_BUS_RECONNECT_DELAY = env.float("EVENT_BUS_RECONNECT_DELAY", 1)
+EVENT_BUS_RECONNECT_DELAY_MAX = env.float("EVENT_BUS_RECONNECT_DELAY_MAX", 30)
+GAME_LONG_POLL_TIMEOUT = env.float("GAME_LONG_POLL_TIMEOUT", 30)
+
+# Matchmaking
+MATCHMAKING_LONG_POLL_TIMEOUT = env.float("MATCHMAKING_LONG_POLL_TIMEOUT", 30)
+MATCHMAKING_WAIT_BUCKETS = env.list(
+    "MATCHMAKING_WAIT_BUCKETS",
+    [1, 5, 15, 30, 60, 120, 300],
+    subcast=float,
+)
+
+# Pagination
+LOBBY_PAGE_SIZE = env.int("LOBBY_PAGE_SIZE", 20)
+LEADERBOARD_SIZE = env.int("LEADERBOARD_SIZE", 20)
+HISTORY_PAGE_SIZE = env.int("HISTORY_PAGE_SIZE", 20)
 
 # Services
 ADMIN_PHONE = env.str("ADMIN_PHONE")
 
 # External services
+HTTP_CLIENT_HTTP2 = env.bool("HTTP_CLIENT_HTTP2", True)
+HTTP_CLIENT_MAX_CONNECTIONS = env.int("HTTP_CLIENT_MAX_CONNECTIONS", 100)
+HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS = env.int("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", 20)
+HTTP_CLIENT_KEEPALIVE_EXPIRY = env.float("HTTP_CLIENT_KEEPALIVE_EXPIRY", 30)
+HTTP_CLIENT_TIMEOUT = env.float("HTTP_CLIENT_TIMEOUT", 10)
+HTTP_CLIENT_CONNECT_TIMEOUT = env.float("HTTP_CLIENT_CONNECT_TIMEOUT", 3)
+NEWTEL_API_URL = env.str("NEWTEL_API_URL", "https://api.new-tel.net/")
+# Consecutive failed calls that stop calls for CALL_BREAKER_RECOVERY_TIMEOUT
+CALL_BREAKER_FAILURE_THRESHOLD = env.int("CALL_BREAKER_FAILURE_THRESHOLD", 5)
+CALL_BREAKER_RECOVERY_TIMEOUT = env.float("CALL_BREAKER_RECOVERY_TIMEOUT", 30)
+CALL_RETRY_ATTEMPTS = env.int("CALL_RETRY_ATTEMPTS", 2)
+CALL_RETRY_BACKOFF = env.float("CALL_RETRY_BACKOFF", 0.2)  # doubles on every attempt, jittered
+CALL_RETRY_BACKOFF_MAX = env.float("CALL_RETRY_BACKOFF_MAX", 2)
+# Share of calls that may be retried, with CALL_RETRY_BUDGET_MAX_TOKENS burst
+CALL_RETRY_BUDGET_RATIO = env.float("CALL_RETRY_BUDGET_RATIO", 0.2)
+CALL_RETRY_BUDGET_MAX_TOKENS = env.float("CALL_RETRY_BUDGET_MAX_TOKENS", 10)
 NEWTEL_API_KEY = env.str("NEWTEL_API_KEY")
 NEWTEL_SIGNING_KEY = env.str("NEWTEL_SIGNING_KEY")
+# Confirmation calls are made in background from call_outbox table, unless
+# disabled (e.g. in tests, which dispatch calls themselves)
+CALL_OUTBOX_ENABLED = env.bool("CALL_OUTBOX_ENABLED", True)
+CALL_OUTBOX_CONCURRENCY = env.int("CALL_OUTBOX_CONCURRENCY", 10)
+CALL_OUTBOX_MAX_ATTEMPTS = env.int("CALL_OUTBOX_MAX_ATTEMPTS", 5)
+CALL_OUTBOX_RETRY_DELAY = env.float("CALL_OUTBOX_RETRY_DELAY", 2)  # doubles on every attempt
+CALL_OUTBOX_POLL_INTERVAL = env.float("CALL_OUTBOX_POLL_INTERVAL", 5)
+# Seconds a claimed call is hidden from other dispatchers
+CALL_OUTBOX_LEASE = env.float("CALL_OUTBOX_LEASE", 60)
+# Seconds a passed confirmation code is reused instead of making a new call
+CONFIRMATION_CODE_COOLDOWN = env.float("CONFIRMATION_CODE_COOLDOWN", 60)
+
+# Janitor, removes expired rows in background on one worker at a time
+JANITOR_INTERVAL = env.float("JANITOR_INTERVAL", 300)
+JANITOR_BATCH_SIZE = env.int("JANITOR_BATCH_SIZE", 500)
+# Seconds after creation when rows expire
+CONFIRMATION_CODE_TTL = env.float("CONFIRMATION_CODE_TTL", 60 * 10)
+CERTIFICATE_TTL = env.float("CERTIFICATE_TTL", 60 * 60)
+OPENED_LOBBY_TTL = env.float("OPENED_LOBBY_TTL", 60 * 60 * 24)
 
 LOG_CONFIG = {
     "level": env.str("LOG_LEVEL"),
@@ -1,5 +1,8 @@
 USER_ALREADY_IN_LOBBY = "User already in lobby"
 USER_NOT_IN_LOBBY = "User not in lobby"
+USER_ALREADY_IN_QUEUE = "User already in matchmaking queue"
+USER_NOT_IN_QUEUE = "User not in matchmaking queue"
+MATCHMAKING_LOBBY_NAME = "Quick match"
 
 LOBBY_DOES_NOT_EXIST = "Lobby does not exist"
 LOBBY_IS_FINISHED = "Lobby is finished"
@@ -26,3 +29,4 @@ UNCONFIRMED_USER = "Unconfirmed user"
 MAX_GAMES_MUST_BE_ODD = "Max games must be odd"
 
 LOBBY_ACCESS_DENIED = "Lobby access denied"
+INCOMPLETE_CURSOR = "Both cursor fields must be passed"
@@ -0,0 +1,140 @@
+import httpx
+import pytest
+
+from rockps import settings
+from rockps.adapters import breakers
+from rockps.adapters import clients
+from rockps.adapters.services.external import call
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(breakers.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+def _fail(breaker):
+    with pytest.raises(ValueError):
+        with breaker:
+            raise ValueError()
+
+
+class TestCircuitBreaker:
+
+    def test_open_after_failures_success(self, clock):
+        breaker = breakers.CircuitBreaker(2, 10, failure_types=(ValueError,))
+        _fail(breaker)
+        assert breaker.state == breakers.CLOSED
+        _fail(breaker)
+        assert breaker.state == breakers.OPEN
+
+        with pytest.raises(breakers.CircuitOpenError) as e:
+            with breaker:
+                pass
+        assert e.value.retry_after == 10
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_probe_success(self, clock):
+        breaker = breakers.CircuitBreaker(1, 10, failure_types=(ValueError,))
+        _fail(breaker)
+        clock.now += 10
+        assert breaker.state == breakers.HALF_OPEN
+
+        with breaker:
+            # Only one probe at a time
+            with pytest.raises(breakers.CircuitOpenError) as e:
+                with breaker:
+                    pass
+            assert e.value.retry_after == 10
+        assert breaker.state == breakers.CLOSED
+
+    def test_half_open_probe_failure_reopens_success(self, clock):
+        breaker = breakers.CircuitBreaker(3, 10, failure_types=(ValueError,))
+        for _ in range(3):
+            _fail(breaker)
+        clock.now += 10
+        _fail(breaker)
+
+        assert breaker.state == breakers.OPEN
+        assert breaker.stats()["opened"] == 2
+
+    def test_other_errors_not_counted_success(self, clock):
+        breaker = breakers.CircuitBreaker(1, 10, failure_types=(ValueError,))
+        with pytest.raises(KeyError):
+            with breaker:
+                raise KeyError()
+        assert breaker.state == breakers.CLOSED
+
+
+class TestRetryBudget:
+
+    def test_withdraw_exhausted_success(self):
+        budget = breakers.RetryBudget(ratio=0.5, max_tokens=1)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+        assert budget.stats()["exhausted"] == 1
+
+
+class TestCallGuard:
+
+    @pytest.fixture
+    def newtel(self, monkeypatch):
+        monkeypatch.setattr(settings, "CALL_RETRY_BACKOFF", 0)
+        monkeypatch.setattr(call, "BREAKER", breakers.CircuitBreaker(
+            2, 10, failure_types=(httpx.HTTPError,),
+        ))
+        monkeypatch.setattr(call, "RETRY_BUDGET", breakers.RetryBudget(
+            ratio=0.2, max_tokens=10,
+        ))
+        responses = []
+
+        def handler(request):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(clients.HttpClients, "_CLIENTS", {
+            "newtel": clients.Httpx(
+                base_url=settings.NEWTEL_API_URL,
+                transport=httpx.MockTransport(handler),
+            ),
+        })
+        return responses
+
+    @pytest.mark.asyncio
+    async def test_retry_connect_error_success(self, newtel):
+        newtel.append(httpx.ConnectError("refused"))
+        newtel.append(httpx.Response(200, json={
+            "status": "success",
+            "data": {"result": "success", "callDetails": {"callId": "1"}},
+        }))
+
+        assert await call.call("+79000000000", 1234) == "1"
+        assert call.RETRY_BUDGET.stats()["retried"] == 1
+        assert call.BREAKER.state == breakers.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_fast_fail_when_open_success(self, newtel):
+        newtel.extend([httpx.Response(503)] * 2)
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await call.call("+79000000000", 1234)
+
+        with pytest.raises(breakers.CircuitOpenError):
+            await call.call("+79000000000", 1234)
+        assert not newtel
@@ -0,0 +1,34 @@
+import time
+
+from rockps.adapters import caches
+
+
+class TestTTLCache:
+
+    def test_get_hit_and_miss_success(self):
+        cache = caches.TTLCache(maxsize=2)
+        cache.set("key", "value", expires_at=time.time() + 60)
+
+        assert cache.get("key") == "value"
+        assert cache.get("other") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_get_expired_success(self):
+        cache = caches.TTLCache(maxsize=2)
+        cache.set("key", "value", expires_at=time.time() - 1)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_set_evicts_least_recently_used_success(self):
+        cache = caches.TTLCache(maxsize=2)
+        expires_at = time.time() + 60
+        cache.set("first", 1, expires_at=expires_at)
+        cache.set("second", 2, expires_at=expires_at)
+        cache.get("first")
+        cache.set("third", 3, expires_at=expires_at)
+
+        assert cache.get("first") == 1
+        assert cache.get("second") is None
+        assert cache.get("third") == 3
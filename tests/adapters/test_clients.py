@@ -0,0 +1,30 @@
+import gc
+
+import pytest
+
+from rockps import settings
+from rockps.adapters import clients
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestHttpx:
+
+    async def test_collected_client_forgotten_success(self):
+        client = clients.Httpx()
+        assert client in clients.Httpx.__refs__
+        await client.aclose()
+
+        count = len(clients.Httpx.__refs__)
+        del client
+        gc.collect()
+        assert len(clients.Httpx.__refs__) == count - 1
+
+
+class TestHttpClients:
+
+    async def test_get_shared_client_success(self):
+        client = clients.HttpClients.get("newtel")
+        assert client is clients.HttpClients.get("newtel")
+        assert str(client.base_url) == settings.NEWTEL_API_URL
+        assert client.timeout.connect == settings.HTTP_CLIENT_CONNECT_TIMEOUT
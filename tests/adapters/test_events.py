@@ -0,0 +1,98 @@
+import asyncio
+
+import asyncpg
+import pytest
+import sqlalchemy as sa
+
+from rockps import settings
+from rockps.adapters import engines
+from rockps.adapters import events
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestEventBus:
+
+    @pytest.mark.parametrize("bus_class", [
+        events.InMemoryBus,
+        lambda: events.PostgresBus(settings.DATABASE_SYNC_URL),
+    ])
+    async def test_publish_subscribe_success(self, bus_class):
+        bus = bus_class()
+        try:
+            async with bus.subscribe("test_channel") as queue:
+                await bus.publish("test_channel", "changed")
+                await bus.publish("other_channel", "ignored")
+                message = await asyncio.wait_for(queue.get(), timeout=5)
+                assert message == "changed"
+                assert queue.empty()
+        finally:
+            await bus.close()
+
+    async def test_subscriber_coalesces_events_success(self):
+        bus = events.InMemoryBus()
+        async with bus.subscribe("test_channel") as queue:
+            await bus.publish("test_channel", "first")
+            await bus.publish("test_channel", "second")
+            assert queue.qsize() == 1
+
+    async def test_postgres_bus_reconnects_success(self, monkeypatch):
+        monkeypatch.setattr(settings, "EVENT_BUS_RECONNECT_DELAY", 0.1)
+        bus = events.PostgresBus(settings.DATABASE_SYNC_URL)
+        try:
+            async with bus.subscribe("test_channel") as queue:
+                lost = bus._connection  # pylint: disable=protected-access
+                async with engines.Database.get().begin() as connection:
+                    await connection.execute(
+                        sa.select(
+                            sa.func.pg_terminate_backend(
+                                lost.get_server_pid(),
+                            ),
+                        )
+                    )
+                # Subscribers are woken to re-read state after reconnect
+                assert await asyncio.wait_for(queue.get(), timeout=5) == ""
+
+                await bus.publish("test_channel", "changed")
+                message = await asyncio.wait_for(queue.get(), timeout=5)
+                assert message == "changed"
+        finally:
+            await bus.close()
+
+    async def test_postgres_bus_waits_for_listen_success(self, monkeypatch):
+        bus = events.PostgresBus(settings.DATABASE_SYNC_URL)
+        listen_gate = asyncio.Event()
+        add_listener = asyncpg.Connection.add_listener
+
+        async def gated_add_listener(connection, *args):
+            await listen_gate.wait()
+            await add_listener(connection, *args)
+
+        async def subscribe(entered: asyncio.Event):
+            async with bus.subscribe("test_channel") as queue:
+                entered.set()
+                return await asyncio.wait_for(queue.get(), timeout=5)
+
+        try:
+            # Connection is opened before LISTEN is held up
+            async with bus.subscribe("other_channel"):
+                monkeypatch.setattr(
+                    asyncpg.Connection,
+                    "add_listener",
+                    gated_add_listener,
+                )
+                entered = [asyncio.Event(), asyncio.Event()]
+                subscribers = []
+                for event in entered:
+                    subscribers.append(asyncio.create_task(subscribe(event)))
+                    await asyncio.sleep(0.1)
+                # Second subscriber waits for the LISTEN of the first one
+                assert not any(event.is_set() for event in entered)
+
+                listen_gate.set()
+                for event in entered:
+                    await asyncio.wait_for(event.wait(), timeout=5)
+                await bus.publish("test_channel", "changed")
+                assert await asyncio.gather(*subscribers) == ["changed"] * 2
+        finally:
+            await bus.close()
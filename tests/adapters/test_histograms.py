@@ -0,0 +1,14 @@
+from rockps.adapters import histograms
+
+
+class TestHistogram:
+
+    def test_observe_success(self):
+        histogram = histograms.Histogram([1, 5])
+        for value in (0.5, 1, 3, 10):
+            histogram.observe(value)
+
+        stats = histogram.stats()
+        assert stats["count"] == 4
+        assert stats["sum"] == 14.5
+        assert stats["buckets"] == {"1": 2, "5": 3, "+Inf": 4}
@@ -0,0 +1,85 @@
+import asyncio
+import datetime
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps import consts
+from rockps.adapters import engines
+from rockps.adapters import events
+from rockps.adapters import janitor
+from rockps.adapters import models
+
+pytestmark = pytest.mark.asyncio
+
+LONG_AGO = datetime.datetime(2000, 1, 1)
+
+
+class TestJanitor:
+
+    async def test_sweep_success(
+        self,
+        session: AsyncSession,
+        user: models.User,
+        lobby: models.Lobby,
+    ):
+        code = models.ConfirmationCode(
+            value="1234",
+            phone=user.phone,
+            type_id=consts.ConfirmationCodeType.RESET,
+            created_dt=LONG_AGO,
+        )
+        fresh_code = models.ConfirmationCode(
+            value="1234",
+            phone=user.phone,
+            type_id=consts.ConfirmationCodeType.RESET,
+        )
+        certificate = models.Certificate(user=user, created_dt=LONG_AGO)
+        session.add_all([code, fresh_code, certificate])
+        lobby.created_dt = LONG_AGO
+        await session.commit()
+
+        async with events.subscribe(
+            events.lobby_channel(lobby.id),
+        ) as queue:
+            reclaimed = await janitor.Janitor.sweep()
+            await asyncio.wait_for(queue.get(), timeout=5)
+        assert reclaimed["confirmation_codes"] >= 1
+        assert reclaimed["certificates"] >= 1
+        assert reclaimed["lobbies"] >= 1
+
+        for obj in (code, certificate):
+            assert await session.get(
+                type(obj),
+                obj.id,
+                populate_existing=True,
+            ) is None
+        await session.refresh(fresh_code)
+        await session.refresh(lobby)
+        await session.refresh(user)
+        assert lobby.lobby_status_id == consts.LobbyStatus.CANCELED
+        assert user.current_lobby_id is None
+        game_statuses = await session.scalars(
+            sa.select(
+                models.Game.game_status_id,
+            ).where(
+                models.Game.lobby_id == lobby.id,
+            )
+        )
+        assert set(game_statuses) == {consts.GameStatus.CANCELED}
+        await session.delete(fresh_code)
+        await session.commit()
+
+    async def test_sweep_not_leader_success(self):
+        lock_key = sa.func.hashtext(janitor.LOCK_NAME)
+        async with engines.Database.get().connect() as connection:
+            await connection.execute(
+                sa.select(sa.func.pg_advisory_lock(lock_key)),
+            )
+            try:
+                assert await janitor.Janitor.sweep() is None
+            finally:
+                await connection.execute(
+                    sa.select(sa.func.pg_advisory_unlock(lock_key)),
+                )
@@ -0,0 +1,70 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps import consts
+from rockps.adapters import models
+from rockps.adapters import outbox
+from rockps.adapters import services
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestCallOutbox:
+
+    @staticmethod
+    async def _enqueue_code(session, phone):
+        code = models.ConfirmationCode(
+            value="1234",
+            phone=phone,
+            type_id=consts.ConfirmationCodeType.CONFIRM,
+        )
+        session.add(code)
+        outbox.enqueue_call(session, code)
+        await session.commit()
+        return code
+
+    @pytest.mark.usefixtures("mock_call_service")
+    async def test_dispatch_success(
+        self,
+        session: AsyncSession,
+        unconfirmed_phone: models.Phone,
+    ):
+        code = await self._enqueue_code(session, unconfirmed_phone)
+        await outbox.CallOutbox.dispatch()
+
+        await session.refresh(code)
+        assert code.call_id == "2363551521608028570"
+        assert await session.scalar(
+            sa.select(models.CallOutbox).where(
+                models.CallOutbox.confirmation_code_id == code.id,
+            )
+        ) is None
+
+    async def test_dispatch_retry_success(
+        self,
+        session: AsyncSession,
+        unconfirmed_phone: models.Phone,
+        monkeypatch,
+    ):
+
+        async def failing_call(*_, **__):
+            raise RuntimeError("unavailable")
+
+        monkeypatch.setattr(services.external.call, "call", failing_call)
+        code = await self._enqueue_code(session, unconfirmed_phone)
+        await outbox.CallOutbox.dispatch()
+
+        call = await session.scalar(
+            sa.select(models.CallOutbox).where(
+                models.CallOutbox.confirmation_code_id == code.id,
+            ).execution_options(
+                populate_existing=True,
+            )
+        )
+        assert call.attempts == 1
+        assert "unavailable" in call.last_error
+        assert await session.scalar(
+            sa.select(call.next_attempt_dt > sa.func.now())
+        )
+        assert code.call_id is None
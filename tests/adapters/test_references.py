@@ -0,0 +1,17 @@
+import pytest
+
+from rockps import consts
+from rockps.adapters import references
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestVerify:
+
+    async def test_verify_success(self):
+        await references.verify()
+
+    async def test_verify_drift_fail(self, monkeypatch):
+        monkeypatch.setattr(consts.LobbyType, "values", lambda: (1, 2, 3))
+        with pytest.raises(references.ReferenceDataDrift):
+            await references.verify()
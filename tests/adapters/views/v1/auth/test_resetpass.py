@@ -1,8 +1,11 @@
 import bcrypt
 import pytest
+import sqlalchemy as sa
 
+from rockps import consts
 from rockps import texts
 from rockps.adapters import models
+from rockps.adapters import outbox
 
 pytestmark = pytest.mark.asyncio
 
@@ -20,6 +23,77 @@ class TestResetPassword:
         assert response.status_code == 200
         assert response_data["id"] == user.id
 
+    @pytest.mark.usefixtures("mock_call_service")
+    async def test_post_request_repeated_reuses_code_success(
+        self,
+        client,
+        user,
+        session,
+    ):
+        for _ in range(2):
+            response = await client.post(
+                url=f"{self.URL}request/",
+                json={"username": str(user.phone)},
+            )
+            assert response.status_code == 200
+
+        codes = (await session.scalars(
+            sa.select(
+                models.ConfirmationCode.id,
+            ).where(
+                models.ConfirmationCode.phone_id == user.phone.id,
+                models.ConfirmationCode.type_id ==
+                    consts.ConfirmationCodeType.RESET,
+            )
+        )).all()
+        assert len(codes) == 1
+
+    @pytest.mark.usefixtures("mock_call_service")
+    async def test_post_request_after_dropped_call_success(
+        self,
+        client,
+        user,
+        session,
+    ):
+        code_ids = sa.select(
+            models.ConfirmationCode.id,
+        ).where(
+            models.ConfirmationCode.phone_id == user.phone.id,
+            models.ConfirmationCode.type_id ==
+                consts.ConfirmationCodeType.RESET,
+        )
+        response = await client.post(
+            url=f"{self.URL}request/",
+            json={"username": str(user.phone)},
+        )
+        assert response.status_code == 200
+        await outbox.CallOutbox.dispatch()
+        # Call outbox drops the call after its last failed attempt
+        await session.execute(
+            sa.delete(
+                models.CallOutbox,
+            ).where(
+                models.CallOutbox.confirmation_code_id.in_(code_ids),
+            )
+        )
+        await session.execute(
+            sa.update(
+                models.ConfirmationCode,
+            ).where(
+                models.ConfirmationCode.id.in_(code_ids),
+            ).values(
+                call_id=None,
+            )
+        )
+        await session.commit()
+
+        response = await client.post(
+            url=f"{self.URL}request/",
+            json={"username": str(user.phone)},
+        )
+        assert response.status_code == 200
+        assert len((await session.scalars(code_ids)).all()) == 2
+
     @pytest.mark.usefixtures("mock_call_service")
     async def test_post_request_wrong_phone_fail(self, client):
         response = await client.post(
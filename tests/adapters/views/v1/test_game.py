@@ -1,6 +1,9 @@
+import asyncio
+
 import httpx
 import pytest
 import sqlalchemy as sa
+from async_asgi_testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from rockps import consts
@@ -52,6 +55,19 @@ class TestGame:
             assert game_data["opponent_ready"] is None
             assert game_data["opponent_nickname"] is None
 
+    @staticmethod
+    async def _start_lobby(session, lobby, second_user):
+        lobby.player_id = second_user.id
+        lobby.lobby_status_id = consts.LobbyStatus.ACTIVE
+        second_user.current_lobby_id = lobby.id
+        game = await session.scalar(
+            sa.select(models.Game).where(models.Game.lobby_id == lobby.id)
+        )
+        game.player_id = second_user.id
+        game.game_status_id = consts.GameStatus.ACTIVE
+        await session.commit()
+        return game
+
     async def test_patch_make_move_success(
         self,
         client: httpx.AsyncClient,
@@ -60,4 +76,326 @@ class TestGame:
         lobby: models.Lobby,
         session: AsyncSession,
     ):
-        pass
+        game = await self._start_lobby(session, lobby, second_user)
+
+        response = await client.patch(
+            url=self.URL,
+            json={"id": game.id, "card_id": consts.Card.ROCK},
+            headers={
+                "Authorization": f"Bearer {user.create_access_token()}"
+            }
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+
+        await session.refresh(game)
+        assert game.creator_card_id == consts.Card.ROCK
+        assert game.game_status_id == consts.GameStatus.ACTIVE
+
+    async def test_patch_finish_game_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        game = await self._start_lobby(session, lobby, second_user)
+        game.creator_card_id = consts.Card.ROCK
+        await session.commit()
+
+        response = await client.patch(
+            url=self.URL,
+            json={"id": game.id, "card_id": consts.Card.SCISSORS},
+            headers={
+                "Authorization": f"Bearer {second_user.create_access_token()}"
+            }
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+
+        await session.refresh(game)
+        assert game.game_status_id == consts.GameStatus.FINISHED
+        assert game.winner_id == user.id
+
+        # The only game of the lobby is played, so the lobby is finished
+        await session.refresh(lobby)
+        assert lobby.creator_wins == 1
+        assert lobby.player_wins == 0
+        assert lobby.current_game_index == 1
+        assert lobby.lobby_status_id == consts.LobbyStatus.FINISHED
+
+        creator_rating = await session.get(models.UserRating, user.id)
+        player_rating = await session.get(models.UserRating, second_user.id)
+        assert creator_rating.rating > player_rating.rating
+        assert creator_rating.games == player_rating.games == 1
+
+        response = await client.get(
+            url="/api/v1/user/",
+            headers={
+                "Authorization": f"Bearer {second_user.create_access_token()}"
+            }
+        )
+        stats = response.json()["stats"]
+        assert stats["games"] == 1
+        assert stats["losses"] == 1
+        assert stats["wins"] == stats["draws"] == 0
+        assert stats["scissors_played"] == 1
+        assert stats["rock_played"] == 0
+
+    async def test_patch_finish_game_twice_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        game = await self._start_lobby(session, lobby, second_user)
+        game.creator_card_id = consts.Card.ROCK
+        await session.commit()
+
+        # Double-submitted final move, only one request finishes the game
+        responses = await asyncio.gather(*(
+            client.patch(
+                url=self.URL,
+                json={"id": game.id, "card_id": consts.Card.SCISSORS},
+                headers={
+                    "Authorization":
+                        f"Bearer {second_user.create_access_token()}"
+                }
+            )
+            for _ in range(2)
+        ))
+        assert sorted(r.status_code for r in responses) == [200, 400]
+
+        await session.refresh(lobby)
+        assert lobby.creator_wins == 1
+        assert lobby.current_game_index == 1
+        creator_rating = await session.get(models.UserRating, user.id)
+        assert creator_rating.games == 1
+        creator_stats = await session.get(models.UserStats, user.id)
+        assert creator_stats.games == 1
+
+    async def test_patch_finish_game_activates_next_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        game = await self._start_lobby(session, lobby, second_user)
+        game.creator_card_id = consts.Card.ROCK
+        next_games = [
+            models.Game(
+                lobby_id=lobby.id,
+                creator_id=user.id,
+                player_id=second_user.id,
+                game_type_id=consts.GameType.STANDARD,
+            )
+            for _ in range(2)
+        ]
+        session.add_all(next_games)
+        await session.commit()
+
+        response = await client.patch(
+            url=self.URL,
+            json={"id": game.id, "card_id": consts.Card.ROCK},
+            headers={
+                "Authorization": f"Bearer {second_user.create_access_token()}"
+            }
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+
+        for obj in (game, *next_games, lobby):
+            await session.refresh(obj)
+        assert game.winner_id is None
+        assert next_games[0].game_status_id == consts.GameStatus.ACTIVE
+        assert next_games[1].game_status_id == consts.GameStatus.PENDING
+        assert lobby.draws == 1
+        assert lobby.current_game_index == 1
+        assert lobby.lobby_status_id == consts.LobbyStatus.ACTIVE
+
+    async def test_patch_invalid_card_fail(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        game = await self._start_lobby(session, lobby, second_user)
+
+        response = await client.patch(
+            url=self.URL,
+            json={"id": game.id, "card_id": consts.Card.SPOCK},
+            headers={
+                "Authorization": f"Bearer {user.create_access_token()}"
+            }
+        )
+        response_data = response.json()
+        assert response.status_code == 400, response_data
+        assert response_data["detail"][0]["msg"] == texts.INVALID_CARD
+
+    async def test_get_long_poll_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        game = await self._start_lobby(session, lobby, second_user)
+        headers = {"Authorization": f"Bearer {user.create_access_token()}"}
+
+        response = await client.get(url=self.URL, headers=headers)
+        assert response.status_code == 200, response.json()
+        version = int(response.headers["X-Lobby-Version"])
+
+        long_poll = asyncio.create_task(client.get(
+            url=self.URL,
+            params={"since_version": version},
+            headers=headers,
+        ))
+        await asyncio.sleep(0.5)
+        assert not long_poll.done()
+
+        response = await client.patch(
+            url=self.URL,
+            json={"id": game.id, "card_id": consts.Card.PAPER},
+            headers={
+                "Authorization": f"Bearer {second_user.create_access_token()}"
+            }
+        )
+        assert response.status_code == 200, response.json()
+
+        response = await asyncio.wait_for(long_poll, 5)
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert int(response.headers["X-Lobby-Version"]) == version + 1
+        assert response_data[0]["opponent_ready"] is True
+
+        # Version already differs, so response isn't delayed
+        response = await asyncio.wait_for(
+            client.get(
+                url=self.URL,
+                params={"since_version": version},
+                headers=headers,
+            ),
+            1,
+        )
+        assert int(response.headers["X-Lobby-Version"]) == version + 1
+
+    async def test_get_not_modified_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        game = await self._start_lobby(session, lobby, second_user)
+        headers = {"Authorization": f"Bearer {user.create_access_token()}"}
+
+        response = await client.get(url=self.URL, headers=headers)
+        assert response.status_code == 200, response.json()
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            url=self.URL,
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["X-Lobby-Version"]
+
+        response = await client.patch(
+            url=self.URL,
+            json={"id": game.id, "card_id": consts.Card.ROCK},
+            headers=headers,
+        )
+        assert response.status_code == 200, response.json()
+
+        response = await client.get(
+            url=self.URL,
+            headers={**headers, "If-None-Match": etag},
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert response_data[0]["creator_card_id"] == consts.Card.ROCK
+
+    async def test_websocket_push_success(
+        self,
+        app,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        game = await self._start_lobby(session, lobby, second_user)
+
+        websocket_client = TestClient(app)
+        async with websocket_client.websocket_connect(
+            f"{self.URL}ws?token={user.create_access_token()}",
+        ) as websocket:
+            games = await asyncio.wait_for(websocket.receive_json(), 5)
+            assert [g["id"] for g in games] == [game.id]
+            assert games[0]["opponent_ready"] is False
+
+            response = await client.patch(
+                url=self.URL,
+                json={"id": game.id, "card_id": consts.Card.PAPER},
+                headers={
+                    "Authorization":
+                        f"Bearer {second_user.create_access_token()}"
+                }
+            )
+            assert response.status_code == 200, response.json()
+
+            games = await asyncio.wait_for(websocket.receive_json(), 5)
+            assert [g["id"] for g in games] == [game.id]
+            assert games[0]["opponent_ready"] is True
+            assert games[0]["player_card_id"] is None
+
+    async def test_websocket_closed_on_leave_success(
+        self,
+        app,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        await self._start_lobby(session, lobby, second_user)
+
+        websocket_client = TestClient(app)
+        async with websocket_client.websocket_connect(
+            f"{self.URL}ws?token={user.create_access_token()}",
+        ) as websocket:
+            await asyncio.wait_for(websocket.receive_json(), 5)
+
+            response = await client.patch(
+                url="/api/v1/lobby/",
+                json={
+                    "id": lobby.id,
+                    "lobby_action_id": consts.LobbyAction.LEAVE,
+                },
+                headers={
+                    "Authorization": f"Bearer {user.create_access_token()}"
+                }
+            )
+            assert response.status_code == 200, response.json()
+
+            with pytest.raises(Exception, match="websocket.close"):
+                await asyncio.wait_for(websocket.receive_json(), 5)
+
+    async def test_websocket_invalid_token_fail(self, app):
+        websocket_client = TestClient(app)
+        # Connection is closed instead of being accepted
+        with pytest.raises(AssertionError):
+            async with websocket_client.websocket_connect(
+                f"{self.URL}ws?token=invalid",
+            ):
+                pass
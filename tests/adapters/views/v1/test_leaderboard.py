@@ -0,0 +1,48 @@
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps.adapters import models
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestLeaderboard:
+    URL = "/api/v1/leaderboard/"
+
+    async def test_get_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        session: AsyncSession,
+    ):
+        session.add_all([
+            models.UserRating(user_id=user.id, rating=1100, games=3),
+            models.UserRating(user_id=second_user.id, rating=1200, games=2),
+        ])
+        await session.commit()
+
+        response = await client.get(
+            url=self.URL,
+            params={"size": 2},
+            headers={
+                "Authorization": f"Bearer {user.create_access_token()}"
+            }
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert response_data == [
+            {
+                "user_id": second_user.id,
+                "nickname": second_user.nickname,
+                "rating": 1200,
+                "games": 2,
+            },
+            {
+                "user_id": user.id,
+                "nickname": user.nickname,
+                "rating": 1100,
+                "games": 3,
+            },
+        ]
@@ -1,9 +1,11 @@
 import httpx
 import pytest
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from rockps import consts
 from rockps import texts
+from rockps.adapters import engines
 from rockps.adapters import models
 
 pytestmark = pytest.mark.asyncio
@@ -38,6 +40,46 @@ class TestLobby:
         await session.refresh(user)
         assert user.current_lobby_id == lobby.id
 
+    async def test_post_round_trips_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        session: AsyncSession,
+    ):
+        statements = []
+
+        def count_statement(*_, **__):
+            statements.append(None)
+
+        engine = engines.Database.get().sync_engine
+        sa.event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            response = await client.post(
+                url=self.URL,
+                json={
+                    "name": "Best Lobby Ever",
+                    "max_games": 5,
+                    "lobby_type_id": consts.LobbyType.STANDARD,
+                },
+                headers={
+                    "Authorization": f"Bearer {user.create_access_token()}"
+                }
+            )
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", count_statement)
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+
+        # One query resolves the user, three create the lobby
+        assert len(statements) == 4
+
+        games = await session.scalars(
+            sa.select(models.Game).where(
+                models.Game.lobby_id == response_data["id"],
+            )
+        )
+        assert len(games.all()) == 5
+
     async def test_post_even_max_games_fail(
         self,
         client: httpx.AsyncClient,
@@ -95,10 +137,94 @@ class TestLobby:
         response_data = response.json()
         assert response.status_code == 200, response_data
 
-        assert response_data[0]["id"] == lobby.id
-        assert response_data[0]["name"] == lobby.name
-        assert response_data[0]["max_games"] == lobby.max_games
-        assert response_data[0]["lobby_type_id"] == lobby.lobby_type_id
+        assert response_data["total"] == 1
+        assert response_data["next_id"] is None
+        item = response_data["items"][0]
+        assert item["id"] == lobby.id
+        assert item["name"] == lobby.name
+        assert item["max_games"] == lobby.max_games
+        assert item["lobby_type_id"] == lobby.lobby_type_id
+        assert item["creator_nickname"] == user.nickname
+
+    async def test_get_paginated_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        lobby: models.Lobby,
+        second_user: models.User,
+        session: AsyncSession,
+    ):
+        second_lobby = models.Lobby(
+            name="Second lobby",
+            creator_id=second_user.id,
+            max_games=5,
+            lobby_type_id=consts.LobbyType.EXTENDED,
+        )
+        session.add(second_lobby)
+        await session.commit()
+        headers = {"Authorization": f"Bearer {user.create_access_token()}"}
+
+        response = await client.get(
+            url=self.URL,
+            params={"size": 1},
+            headers=headers,
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert response_data["total"] == 2
+        assert [i["id"] for i in response_data["items"]] == [lobby.id]
+
+        response = await client.get(
+            url=self.URL,
+            params={"size": 1, "after_id": response_data["next_id"]},
+            headers=headers,
+        )
+        response_data = response.json()
+        assert [i["id"] for i in response_data["items"]] == [second_lobby.id]
+        assert response_data["items"][0]["creator_nickname"] == \
+            second_user.nickname
+
+        response = await client.get(
+            url=self.URL,
+            params={"lobby_type_id": consts.LobbyType.EXTENDED},
+            headers=headers,
+        )
+        response_data = response.json()
+        assert response_data["total"] == 1
+        assert [i["id"] for i in response_data["items"]] == [second_lobby.id]
+
+        await session.delete(second_lobby)
+        await session.commit()
+
+    async def test_get_not_modified_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        headers = {"Authorization": f"Bearer {user.create_access_token()}"}
+        response = await client.get(url=self.URL, headers=headers)
+        assert response.status_code == 200, response.json()
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            url=self.URL,
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+        lobby.lobby_status_id = consts.LobbyStatus.CANCELED
+        await session.commit()
+        response = await client.get(
+            url=self.URL,
+            headers={**headers, "If-None-Match": etag},
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert response_data["total"] == 0
+        assert response.headers["ETag"] != etag
 
     async def test_patch_join_success(
         self,
@@ -132,6 +258,41 @@ class TestLobby:
         await session.refresh(second_user)
         assert second_user.current_lobby_id == lobby.id
 
+        game = await session.scalar(
+            sa.select(models.Game).where(models.Game.lobby_id == lobby.id)
+        )
+        await session.refresh(game)
+        assert game.player_id == second_user.id
+        assert game.game_status_id == consts.GameStatus.ACTIVE
+
+    async def test_patch_leave_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        lobby: models.Lobby,
+        session: AsyncSession,
+    ):
+        response = await client.patch(
+            url=self.URL,
+            json={"lobby_action_id": consts.LobbyAction.LEAVE},
+            headers={
+                "Authorization": f"Bearer {user.create_access_token()}"
+            }
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+
+        await session.refresh(lobby)
+        assert lobby.lobby_status_id == consts.LobbyStatus.CANCELED
+        await session.refresh(user)
+        assert user.current_lobby_id is None
+
+        game = await session.scalar(
+            sa.select(models.Game).where(models.Game.lobby_id == lobby.id)
+        )
+        await session.refresh(game)
+        assert game.game_status_id == consts.GameStatus.CANCELED
+
     async def test_patch_third_user_join_fail(
         self,
         client: httpx.AsyncClient,
@@ -0,0 +1,141 @@
+import asyncio
+
+import fastapi
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps import cases
+from rockps import consts
+from rockps import texts
+from rockps.adapters import events
+from rockps.adapters import models
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestMatchmaking:
+    URL = "/api/v1/matchmaking/"
+
+    async def test_post_pair_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        session: AsyncSession,
+        metrics_headers: dict,
+    ):
+        headers = {"Authorization": f"Bearer {user.create_access_token()}"}
+        data = {"max_games": 3, "lobby_type_id": consts.LobbyType.STANDARD}
+
+        response = await client.post(url=self.URL, json=data, headers=headers)
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert response_data["lobby_id"] is None
+
+        long_poll = asyncio.create_task(
+            client.get(url=self.URL, headers=headers),
+        )
+        await asyncio.sleep(0.5)
+        assert not long_poll.done()
+
+        response = await client.post(
+            url=self.URL,
+            json=data,
+            headers={
+                "Authorization": f"Bearer {second_user.create_access_token()}"
+            },
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        lobby_id = response_data["lobby_id"]
+        assert lobby_id is not None
+
+        response = await asyncio.wait_for(long_poll, 5)
+        assert response.json()["lobby_id"] == lobby_id
+
+        lobby = await session.get(models.Lobby, lobby_id)
+        assert lobby.creator_id == user.id
+        assert lobby.player_id == second_user.id
+        assert lobby.lobby_status_id == consts.LobbyStatus.ACTIVE
+        assert lobby.max_games == 3
+
+        response = await client.get(
+            url="/api/v1/metrics/",
+            headers=metrics_headers,
+        )
+        assert response.json()["matchmaking_wait_time"]["count"] >= 1
+
+    async def test_delete_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+    ):
+        headers = {"Authorization": f"Bearer {user.create_access_token()}"}
+        response = await client.post(
+            url=self.URL,
+            json={"max_games": 1, "lobby_type_id": consts.LobbyType.STANDARD},
+            headers=headers,
+        )
+        assert response.status_code == 200, response.json()
+
+        response = await client.delete(url=self.URL, headers=headers)
+        assert response.status_code == 200, response.json()
+
+        response = await client.delete(url=self.URL, headers=headers)
+        response_data = response.json()
+        assert response.status_code == 404, response_data
+        assert response_data["detail"][0]["msg"] == texts.USER_NOT_IN_QUEUE
+
+    async def test_create_lobby_drops_ticket_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+    ):
+        headers = {"Authorization": f"Bearer {user.create_access_token()}"}
+        data = {"max_games": 1, "lobby_type_id": consts.LobbyType.STANDARD}
+        response = await client.post(url=self.URL, json=data, headers=headers)
+        assert response.status_code == 200, response.json()
+
+        response = await client.post(
+            url="/api/v1/lobby/",
+            json={"name": "Lobby", **data},
+            headers=headers,
+        )
+        assert response.status_code == 200, response.json()
+
+        response = await client.delete(url=self.URL, headers=headers)
+        response_data = response.json()
+        assert response.status_code == 404, response_data
+        assert response_data["detail"][0]["msg"] == texts.USER_NOT_IN_QUEUE
+
+    async def test_pop_own_ticket_fail(
+        self,
+        user: models.User,
+        session: AsyncSession,
+    ):
+        data = {"max_games": 1, "lobby_type_id": consts.LobbyType.STANDARD}
+        ticket = models.MatchmakingTicket(user_id=user.id, **data)
+        session.add(ticket)
+        await session.commit()
+
+        # Ticket queued by a concurrent request of the same user
+        case = cases.CreateMatchmakingTicket(
+            model=models.MatchmakingTicket,
+            lobby_model=models.Lobby,
+            game_model=models.Game,
+            user_model=models.User,
+            event_service=events,
+            data={"user_id": user.id, **data},
+            session=session,
+        )
+        await case.lock_queue()
+        assert await case.pop_opponent_ticket() is None
+        with pytest.raises(fastapi.HTTPException) as error:
+            await case.execute()
+        assert error.value.status_code == 400
+        assert error.value.detail[0]["msg"] == texts.USER_ALREADY_IN_QUEUE
+
+        await session.rollback()
+        await session.delete(ticket)
+        await session.commit()
@@ -0,0 +1,91 @@
+import httpx
+import pytest
+
+from rockps import settings
+from rockps.adapters import models
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestMetrics:
+    URL = "/api/v1/metrics/"
+
+    @pytest.mark.usefixtures("user")
+    async def test_get_password_hasher_success(
+        self,
+        client: httpx.AsyncClient,
+        metrics_headers: dict,
+    ):
+        await client.post(
+            url="/api/v1/auth/signin/",
+            data={"username": settings.ADMIN_PHONE, "password": "qwerty123"},
+        )
+        response = await client.get(url=self.URL, headers=metrics_headers)
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+
+        hasher = response_data["password_hasher"]
+        assert hasher["completed"] >= 1
+        assert hasher["queued"] == 0
+        assert hasher["running"] == 0
+
+    async def test_get_database_pool_success(
+        self,
+        client: httpx.AsyncClient,
+        metrics_headers: dict,
+    ):
+        response = await client.get(url=self.URL, headers=metrics_headers)
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+
+        database = response_data["database"]
+        assert database["pool"] == settings.DATABASE_POOL_CLASS
+        assert database["max_wait"] >= 0
+
+    async def test_get_one_session_per_request_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        metrics_headers: dict,
+    ):
+        response = await client.get(url=self.URL, headers=metrics_headers)
+        opened = response.json()["sessions"]["opened"]
+
+        # Both access.get_user and the view itself depend on a session
+        await client.get(
+            url="/api/v1/lobby/",
+            headers={
+                "Authorization": f"Bearer {user.create_access_token()}"
+            }
+        )
+
+        response = await client.get(url=self.URL, headers=metrics_headers)
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert response_data["sessions"]["opened"] == opened + 1
+
+    async def test_get_wrong_token_fail(
+        self,
+        client: httpx.AsyncClient,
+        metrics_headers: dict,
+    ):
+        response = await client.get(
+            url=self.URL,
+            headers={"Authorization": "Bearer wrong-token"},
+        )
+        assert response.status_code == 401, response.json()
+
+        response = await client.get(url=self.URL)
+        assert response.status_code == 401, response.json()
+
+    async def test_get_without_metrics_token_fail(
+        self,
+        client: httpx.AsyncClient,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+        response = await client.get(
+            url=self.URL,
+            headers={"Authorization": "Bearer "},
+        )
+        assert response.status_code == 404, response.json()
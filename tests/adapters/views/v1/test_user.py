@@ -1,10 +1,16 @@
 import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from rockps import consts
+from rockps import texts
 from rockps.adapters import models
 
+pytestmark = pytest.mark.asyncio
+
 
 class TestUser:
-    URL = "/api/v1/user"
+    URL = "/api/v1/user/"
 
     async def test_get_success(
         self,
@@ -24,3 +30,96 @@ class TestUser:
         assert response_data["id"] == user.id
         assert response_data["nickname"] == user.nickname
         assert response_data["current_lobby_id"] == lobby.id
+        assert response_data["stats"]["games"] == 0
+
+    async def test_get_unconfirmed_user_fail(
+        self,
+        client: httpx.AsyncClient,
+        unconfirmed_user: models.User,
+    ):
+        response = await client.get(
+            url=self.URL,
+            headers={
+                "Authorization":
+                    f"Bearer {unconfirmed_user.create_access_token()}"
+            }
+        )
+        response_data = response.json()
+        assert response.status_code == 400, response_data
+        assert response_data["detail"][0]["msg"] == texts.UNCONFIRMED_USER
+
+    async def test_get_history_success(
+        self,
+        client: httpx.AsyncClient,
+        user: models.User,
+        second_user: models.User,
+        session: AsyncSession,
+    ):
+        # Second user is the player of some lobbies and creator of another
+        players = [
+            (user, second_user),
+            (second_user, user),
+            (user, second_user),
+        ]
+        lobbies = [
+            models.Lobby(
+                name=f"Lobby {i}",
+                creator_id=creator.id,
+                player_id=player.id,
+                max_games=1,
+                lobby_type_id=consts.LobbyType.STANDARD,
+                lobby_status_id=consts.LobbyStatus.FINISHED,
+                creator_wins=1,
+            )
+            for i, (creator, player) in enumerate(players)
+        ]
+        session.add_all(lobbies)
+        await session.flush()
+        session.add_all([
+            models.Game(
+                lobby_id=lobby.id,
+                creator_id=lobby.creator_id,
+                player_id=lobby.player_id,
+                creator_card_id=consts.Card.ROCK,
+                player_card_id=consts.Card.SCISSORS,
+                winner_id=user.id,
+                game_status_id=consts.GameStatus.FINISHED,
+                game_type_id=consts.GameType.STANDARD,
+            )
+            for lobby in lobbies
+        ])
+        await session.commit()
+        headers = {
+            "Authorization": f"Bearer {second_user.create_access_token()}"
+        }
+
+        response = await client.get(
+            url=f"{self.URL}history",
+            params={"size": 2},
+            headers=headers,
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert [i["id"] for i in response_data["items"]] == \
+            [lobbies[2].id, lobbies[1].id]
+        game = response_data["items"][0]["games"][0]
+        assert game["player_card_id"] == consts.Card.SCISSORS
+        assert game["winner_id"] == user.id
+
+        response = await client.get(
+            url=f"{self.URL}history",
+            params={
+                "size": 2,
+                "before_created_dt": response_data["next_created_dt"],
+                "before_id": response_data["next_id"],
+            },
+            headers=headers,
+        )
+        response_data = response.json()
+        assert response.status_code == 200, response_data
+        assert [i["id"] for i in response_data["items"]] == [lobbies[0].id]
+        assert response_data["next_id"] is None
+
+        for lobby in lobbies:
+            await session.delete(lobby)
+        await session.commit()
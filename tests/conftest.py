@@ -45,6 +45,8 @@ def event_loop(request):
 
 @pytest_asyncio.fixture(scope='session', autouse=True)
 async def app():
+    # Tests make calls of call_outbox by CallOutbox.dispatch() themselves
+    settings.CALL_OUTBOX_ENABLED = False
     app = rockps.init()
     await app.router.startup()
     yield app
@@ -81,6 +83,12 @@ def mock_call_service(monkeypatch, pytestconfig):
         )
     yield
 
+
+@pytest_asyncio.fixture
+def metrics_headers(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "metrics-token")
+    return {"Authorization": "Bearer metrics-token"}
+
 # Database fixtures
 
 
@@ -0,0 +1,26 @@
+import pytest
+
+from rockps.entities import ratings
+
+
+@pytest.mark.parametrize("creator_wins, player_wins, score", [
+    (2, 1, ratings.WIN),
+    (1, 1, ratings.DRAW),
+    (0, 3, ratings.LOSS),
+])
+def test_lobby_score_success(creator_wins, player_wins, score):
+    assert ratings.lobby_score(creator_wins, player_wins) == score
+
+
+def test_rate_equal_opponents_success():
+    winner, loser = ratings.rate(1000, 1000, ratings.WIN)
+    assert winner == 1000 + ratings.K_FACTOR / 2
+    assert loser == 1000 - ratings.K_FACTOR / 2
+
+    assert ratings.rate(1000, 1000, ratings.DRAW) == (1000, 1000)
+
+
+def test_rate_keeps_sum_success():
+    first, second = ratings.rate(1200, 900, ratings.LOSS)
+    assert first < 1200 < first + ratings.K_FACTOR
+    assert first + second == pytest.approx(2100)
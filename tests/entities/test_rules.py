@@ -0,0 +1,65 @@
+import itertools
+
+import pytest
+
+from rockps import consts
+from rockps.entities import rules
+
+Card = consts.Card
+
+EXTENDED_BEATS = {
+    (Card.ROCK, Card.SCISSORS),
+    (Card.SCISSORS, Card.PAPER),
+    (Card.PAPER, Card.ROCK),
+    (Card.ROCK, Card.LIZARD),
+    (Card.LIZARD, Card.SPOCK),
+    (Card.SPOCK, Card.SCISSORS),
+    (Card.SCISSORS, Card.LIZARD),
+    (Card.LIZARD, Card.PAPER),
+    (Card.PAPER, Card.SPOCK),
+    (Card.SPOCK, Card.ROCK),
+}
+
+
+class TestRules:
+
+    @pytest.mark.parametrize("game_type_id, cards", [
+        (consts.GameType.STANDARD, (Card.ROCK, Card.PAPER, Card.SCISSORS)),
+        (consts.GameType.EXTENDED, tuple(Card)),
+    ])
+    def test_compare_matches_classic_rules_success(self, game_type_id, cards):
+        game_rules = rules.GAME_RULES[game_type_id]
+        for first, second in itertools.product(cards, repeat=2):
+            if first == second:
+                expected = rules.DRAW
+            elif (first, second) in EXTENDED_BEATS:
+                expected = rules.FIRST_WINS
+            else:
+                expected = rules.SECOND_WINS
+            assert game_rules.compare(first, second) == expected
+
+    def test_is_valid_standard_success(self):
+        game_rules = rules.GAME_RULES[consts.GameType.STANDARD]
+        assert game_rules.is_valid(Card.SCISSORS)
+        assert not game_rules.is_valid(Card.LIZARD)
+
+    def test_cyclic_seven_cards_balanced_success(self):
+        game_rules = rules.Rules.cyclic(range(1, 8))
+        for card in range(1, 8):
+            outcomes = [game_rules.compare(card, other) for other in range(1, 8)]
+            assert outcomes.count(rules.FIRST_WINS) == 3
+            assert outcomes.count(rules.SECOND_WINS) == 3
+
+    def test_cyclic_even_cards_fail(self):
+        with pytest.raises(ValueError):
+            rules.Rules.cyclic(range(1, 5))
+
+    def test_compare_many_success(self):
+        game_rules = rules.GAME_RULES[consts.GameType.EXTENDED]
+        first_cards = [Card.ROCK, Card.PAPER, Card.SPOCK]
+        second_cards = [Card.SCISSORS, Card.LIZARD, Card.SPOCK]
+        assert game_rules.compare_many(first_cards, second_cards) == [
+            rules.FIRST_WINS,
+            rules.SECOND_WINS,
+            rules.DRAW,
+        ]
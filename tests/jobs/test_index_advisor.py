@@ -0,0 +1,29 @@
+import pytest
+
+from rockps.jobs import index_advisor
+
+
+def test_find_seq_scans_success():
+    plan = {
+        "Node Type": "Nested Loop",
+        "Plans": [
+            {"Node Type": "Seq Scan", "Relation Name": "lobby"},
+            {
+                "Node Type": "Index Scan",
+                "Relation Name": "user",
+                "Plans": [{"Node Type": "Seq Scan", "Relation Name": "game"}],
+            },
+        ],
+    }
+    assert index_advisor.find_seq_scans(plan) == ["lobby", "game"]
+
+
+@pytest.mark.asyncio
+async def test_explain_success():
+    report = await index_advisor.explain({
+        "SELECT id FROM game WHERE winner_id = $1": (1,),
+        "SELECT id FROM game WHERE game_type_id = $1": (1,),
+    })
+    assert report == {
+        "SELECT id FROM game WHERE game_type_id = $1": ["game"],
+    }
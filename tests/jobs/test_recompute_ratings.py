@@ -0,0 +1,105 @@
+import datetime
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rockps import consts
+from rockps import entities
+from rockps.adapters import models
+from rockps.jobs import ratings
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_recompute_success(
+    user: models.User,
+    second_user: models.User,
+    lobby: models.Lobby,
+    session: AsyncSession,
+):
+    lobby.player_id = second_user.id
+    lobby.lobby_status_id = consts.LobbyStatus.FINISHED
+    game = await session.scalar(
+        sa.select(models.Game).where(models.Game.lobby_id == lobby.id)
+    )
+    game.player_id = second_user.id
+    game.creator_card_id = consts.Card.ROCK
+    game.player_card_id = consts.Card.PAPER
+    game.winner_id = second_user.id
+    game.game_status_id = consts.GameStatus.FINISHED
+    await session.commit()
+
+    assert await ratings.recompute(session, chunk_size=1) == 1
+    await session.commit()
+
+    player_rating, creator_rating = entities.ratings.rate(
+        entities.ratings.INITIAL_RATING,
+        entities.ratings.INITIAL_RATING,
+        entities.ratings.WIN,
+    )
+    result = await session.execute(
+        sa.select(
+            models.UserRating.user_id,
+            models.UserRating.rating,
+            models.UserRating.games,
+        )
+    )
+    assert sorted(result.all()) == sorted([
+        (user.id, creator_rating, 1),
+        (second_user.id, player_rating, 1),
+    ])
+
+
+async def test_recompute_in_finish_order_success(
+    user: models.User,
+    second_user: models.User,
+    session: AsyncSession,
+):
+    finished_dt = datetime.datetime(2026, 1, 1)
+    # The first lobby finishes last
+    for winner, minutes in ((user, 1), (second_user, 0)):
+        lobby = models.Lobby(
+            name="Rated lobby",
+            creator_id=user.id,
+            player_id=second_user.id,
+            max_games=1,
+            lobby_type_id=consts.LobbyType.STANDARD,
+            lobby_status_id=consts.LobbyStatus.FINISHED,
+            finished_dt=finished_dt + datetime.timedelta(minutes=minutes),
+        )
+        session.add(models.Game(
+            lobby=lobby,
+            creator_id=user.id,
+            player_id=second_user.id,
+            creator_card_id=consts.Card.ROCK,
+            player_card_id=consts.Card.PAPER,
+            winner_id=winner.id,
+            game_status_id=consts.GameStatus.FINISHED,
+            game_type_id=consts.GameType.STANDARD,
+        ))
+    await session.commit()
+
+    assert await ratings.recompute(session, chunk_size=1) == 2
+    await session.commit()
+
+    user_rating, second_user_rating = entities.ratings.rate(
+        entities.ratings.INITIAL_RATING,
+        entities.ratings.INITIAL_RATING,
+        entities.ratings.LOSS,
+    )
+    user_rating, second_user_rating = entities.ratings.rate(
+        user_rating,
+        second_user_rating,
+        entities.ratings.WIN,
+    )
+    result = await session.execute(
+        sa.select(
+            models.UserRating.user_id,
+            models.UserRating.rating,
+        )
+    )
+    assert sorted(result.all()) == sorted([
+        (user.id, user_rating),
+        (second_user.id, second_user_rating),
+    ])